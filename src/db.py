@@ -56,6 +56,8 @@ CREATE TABLE IF NOT EXISTS trades (
 CREATE INDEX IF NOT EXISTS idx_trades_ticker   ON trades(ticker);
 CREATE INDEX IF NOT EXISTS idx_trades_ts       ON trades(timestamp);
 CREATE INDEX IF NOT EXISTS idx_trades_is_paper ON trades(is_paper);
+-- graduation_stats: WHERE strategy = ? AND is_paper = ? [ORDER BY timestamp]
+CREATE INDEX IF NOT EXISTS idx_trades_strategy_paper_ts ON trades(strategy, is_paper, timestamp);
 
 CREATE TABLE IF NOT EXISTS daily_pnl (
     id                  INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -90,6 +92,17 @@ CREATE TABLE IF NOT EXISTS kill_switch_events (
 );
 """
 
+# graduation_stats() result when a strategy has no settled trades
+_EMPTY_GRADUATION_STATS: Dict[str, Any] = {
+    "settled_count": 0,
+    "win_rate": None,
+    "brier_score": None,
+    "consecutive_losses": 0,
+    "first_trade_ts": None,
+    "days_running": 0.0,
+    "total_pnl_usd": 0.0,
+}
+
 
 class DB:
     """
@@ -312,12 +325,14 @@ class DB:
         trigger_type: str,
         reason: str,
         bankroll_at_trigger: Optional[float] = None,
+        ts: Optional[float] = None,
     ):
+        """Log a kill switch event. ts defaults to now (override for backfills/tests)."""
         self._conn.execute(
             """INSERT INTO kill_switch_events
                (timestamp, trigger_type, reason, bankroll_at_trigger)
                VALUES (?, ?, ?, ?)""",
-            (time.time(), trigger_type, reason, bankroll_at_trigger),
+            (time.time() if ts is None else ts, trigger_type, reason, bankroll_at_trigger),
         )
         self._conn.commit()
 
@@ -480,18 +495,19 @@ class DB:
         prevents a stale streak from triggering a fresh 2hr cooling period on every
         restart when the losses happened hours/days ago.
         """
+        # Iterate the cursor rather than fetchall(): the walk stops at the first
+        # win, so only the tail of the history is ever read.
         rows = self._conn.execute(
             """SELECT result, side, timestamp
                FROM trades
                WHERE is_paper = 0
                  AND result IS NOT NULL
-               ORDER BY timestamp DESC""",
-        ).fetchall()
+               ORDER BY timestamp DESC, id DESC""",
+        )
 
         streak = 0
         last_loss_ts: float | None = None
-        for row in rows:
-            result, side, ts = row[0], row[1], row[2]
+        for result, side, ts in rows:
             if result != side:
                 streak += 1
                 if last_loss_ts is None:
@@ -529,16 +545,19 @@ class DB:
             count += 1
         return count
 
-    def total_realized_pnl_usd(self, is_paper: Optional[bool] = None) -> float:
-        """Return sum of all settled P&L in USD."""
-        query = "SELECT SUM(pnl_cents) FROM trades WHERE result IS NOT NULL"
+    def total_realized_pnl_cents(self, is_paper: Optional[bool] = None) -> int:
+        """Return sum of all settled P&L in integer cents (exact — no float rounding)."""
+        query = "SELECT COALESCE(SUM(pnl_cents), 0) FROM trades WHERE result IS NOT NULL"
         params: list = []
         if is_paper is not None:
             query += " AND is_paper = ?"
             params.append(int(is_paper))
         row = self._conn.execute(query, params).fetchone()
-        total_cents = row[0] or 0
-        return total_cents / 100.0
+        return int(row[0] or 0)
+
+    def total_realized_pnl_usd(self, is_paper: Optional[bool] = None) -> float:
+        """Return sum of all settled P&L in USD."""
+        return self.total_realized_pnl_cents(is_paper=is_paper) / 100.0
 
     def graduation_stats(self, strategy: str, is_paper: Optional[bool] = True) -> dict:
         """
@@ -564,59 +583,48 @@ class DB:
         if is_paper is not None:
             ip_filter = f" AND is_paper = {int(is_paper)}"
 
-        # Settled trades for this strategy, oldest first
-        rows = self._conn.execute(
-            f"""SELECT result, side, win_prob, pnl_cents, timestamp
+        # One pass over the strategy's rows for every aggregate. first_ts covers
+        # all trades (including unsettled); the rest only settled ones.
+        agg = self._conn.execute(
+            f"""SELECT
+                   COUNT(*) FILTER (WHERE result IS NOT NULL),
+                   SUM(result = side) FILTER (WHERE result IS NOT NULL),
+                   AVG((win_prob - (result = side)) * (win_prob - (result = side)))
+                       FILTER (WHERE result IS NOT NULL AND win_prob IS NOT NULL),
+                   SUM(COALESCE(pnl_cents, 0)) FILTER (WHERE result IS NOT NULL),
+                   MIN(timestamp)
                FROM trades
-               WHERE strategy = ?{ip_filter} AND result IS NOT NULL
-               ORDER BY timestamp ASC""",
+               WHERE strategy = ?{ip_filter}""",
             (strategy,),
-        ).fetchall()
+        ).fetchone()
 
-        if not rows:
-            return {
-                "settled_count": 0,
-                "win_rate": None,
-                "brier_score": None,
-                "consecutive_losses": 0,
-                "first_trade_ts": None,
-                "days_running": 0.0,
-                "total_pnl_usd": 0.0,
-            }
-
-        rows = [dict(r) for r in rows]
-
-        settled_count = len(rows)
-        wins = sum(1 for r in rows if r["result"] == r["side"])
-        win_rate = wins / settled_count
-
-        # Brier score: only trades that have win_prob recorded
-        brier_rows = [r for r in rows if r["win_prob"] is not None]
-        if brier_rows:
-            brier_score = sum(
-                (r["win_prob"] - (1.0 if r["result"] == r["side"] else 0.0)) ** 2
-                for r in brier_rows
-            ) / len(brier_rows)
-        else:
-            brier_score = None
+        settled_count = agg[0] or 0
+        if settled_count == 0:
+            # Short-circuit: no settled trades → skip the streak query entirely.
+            return dict(_EMPTY_GRADUATION_STATS)
+
+        win_rate = (agg[1] or 0) / settled_count
+        # Brier score: only trades that have win_prob recorded (NULL if none)
+        brier_score = agg[2]
 
-        # Consecutive losses at end of history
+        # Consecutive losses at end of history — newest first, stop at the first win.
+        # Iterating the cursor (no fetchall) means SQLite stops reading there too.
         consecutive_losses = 0
-        for r in reversed(rows):
-            if r["result"] != r["side"]:
-                consecutive_losses += 1
-            else:
+        for result, side in self._conn.execute(
+            f"""SELECT result, side
+               FROM trades
+               WHERE strategy = ?{ip_filter} AND result IS NOT NULL
+               ORDER BY timestamp DESC, id DESC""",
+            (strategy,),
+        ):
+            if result == side:
                 break
+            consecutive_losses += 1
 
-        # First trade timestamp (any result — including unsettled), filtered by is_paper
-        first_row = self._conn.execute(
-            f"SELECT MIN(timestamp) FROM trades WHERE strategy = ?{ip_filter}",
-            (strategy,),
-        ).fetchone()
-        first_trade_ts = first_row[0] if first_row and first_row[0] else None
+        first_trade_ts = agg[4] or None
         days_running = (_time.time() - first_trade_ts) / 86400.0 if first_trade_ts else 0.0
 
-        total_pnl_usd = sum((r["pnl_cents"] or 0) for r in rows) / 100.0
+        total_pnl_usd = (agg[3] or 0) / 100.0
 
         return {
             "settled_count": settled_count,
@@ -27,13 +27,14 @@ import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 LOCK_FILE = PROJECT_ROOT / "kill_switch.lock"
 EVENT_LOG = PROJECT_ROOT / "KILL_SWITCH_EVENT.log"
+BLOCKERS_FILE = PROJECT_ROOT / "BLOCKERS.md"
 
 # ── Hard limits — these cannot be changed by config ──────────────
 HARD_MAX_TRADE_USD = 50.00        # S153: auto-raised from 35→50 (gate 100 post-guard clean bets reached at 108 — pre-authorized S140/S142). Ramp: 50→40 at bet 50, 100→50 at bet 100. S142: raised from 10→35 — data shows 90-94c zone yields +16 USD/day avg.
@@ -49,8 +50,13 @@ MAX_TRADE_PCT = 0.08              # 8% of bankroll per trade (S130: reduced from
 class KillSwitchState:
     """All mutable state for the kill switch. Persisted to disk on hard stops."""
 
-    def __init__(self, starting_bankroll_usd: float):
+    def __init__(
+        self,
+        starting_bankroll_usd: float,
+        clock: Callable[[], float] = time.time,
+    ):
         self.starting_bankroll = starting_bankroll_usd
+        self._clock = clock  # unix-time source; injectable for tests
 
         # Hard stop state
         self._hard_stop: bool = False
@@ -80,11 +86,14 @@ class KillSwitchState:
         # Lifetime bankroll loss tracking
         self._realized_loss_usd: float = 0.0
 
+    def _utcnow(self) -> datetime:
+        return datetime.fromtimestamp(self._clock(), timezone.utc)
+
     def _today(self) -> str:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        return self._utcnow().strftime("%Y-%m-%d")
 
     def _current_hour(self) -> str:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d-%H")
+        return self._utcnow().strftime("%Y-%m-%d-%H")
 
     def _rotate_daily(self):
         today = self._today()
@@ -108,7 +117,7 @@ class KillSwitchState:
             self._hourly_trades = 0
 
     def _check_cooling_expired(self):
-        if self._cooling_until and time.time() > self._cooling_until:
+        if self._cooling_until and self._clock() > self._cooling_until:
             logger.info("Cooling period expired — consecutive loss counter reset")
             self._cooling_until = None
             self._consecutive_losses = 0
@@ -123,8 +132,12 @@ class KillSwitch:
     All methods are synchronous.
     """
 
-    def __init__(self, starting_bankroll_usd: float):
-        self._state = KillSwitchState(starting_bankroll_usd)
+    def __init__(
+        self,
+        starting_bankroll_usd: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._state = KillSwitchState(starting_bankroll_usd, clock=clock)
         logger.info("KillSwitch initialized (starting bankroll: $%.2f)", starting_bankroll_usd)
 
     # ── Pre-trade gate ────────────────────────────────────────────
@@ -156,8 +169,8 @@ class KillSwitch:
 
         # ── Soft stops (may auto-reset) ──────────────────────────
         if state._soft_stop:
-            if state._soft_stop_until and time.time() < state._soft_stop_until:
-                remaining_min = (state._soft_stop_until - time.time()) / 60
+            if state._soft_stop_until and state._clock() < state._soft_stop_until:
+                remaining_min = (state._soft_stop_until - state._clock()) / 60
                 return False, f"SOFT STOP: {state._soft_stop_reason} ({remaining_min:.0f}min remaining)"
             elif not state._soft_stop_until:
                 return False, f"SOFT STOP: {state._soft_stop_reason}"
@@ -193,8 +206,8 @@ class KillSwitch:
         #     return False, f"SOFT STOP: {reason}"
 
         # ── Consecutive loss cooling ──────────────────────────────
-        if state._cooling_until and time.time() < state._cooling_until:
-            remaining_min = (state._cooling_until - time.time()) / 60
+        if state._cooling_until and state._clock() < state._cooling_until:
+            remaining_min = (state._cooling_until - state._clock()) / 60
             return False, f"Cooling period: {state._consecutive_losses} consecutive losses ({remaining_min:.0f}min remaining)"
 
         # ── Hourly rate limit ─────────────────────────────────────
@@ -267,7 +280,7 @@ class KillSwitch:
 
         # Check consecutive loss limit
         if self._state._consecutive_losses >= CONSECUTIVE_LOSS_LIMIT:
-            until = time.time() + (COOLING_PERIOD_HOURS * 3600)
+            until = self._state._clock() + (COOLING_PERIOD_HOURS * 3600)
             self._state._cooling_until = until
             reason = f"{self._state._consecutive_losses} consecutive losses — cooling {COOLING_PERIOD_HOURS}hr"
             self._state._soft_stop = True
@@ -320,7 +333,7 @@ class KillSwitch:
         after already reaching the 4-loss cooling threshold.
 
         KEY SAFETY RULE: Only triggers a NEW cooling period if the last loss
-        happened WITHIN the cooling window (i.e. time.time() - last_loss_ts <
+        happened WITHIN the cooling window (i.e. now - last_loss_ts <
         COOLING_PERIOD_HOURS * 3600). If the losses are older than the window,
         the 2-hour cooling was already served in the previous session — we only
         seed the counter so the NEXT loss triggers immediately.
@@ -345,7 +358,7 @@ class KillSwitch:
         )
         if count >= CONSECUTIVE_LOSS_LIMIT:
             cooling_window_sec = COOLING_PERIOD_HOURS * 3600
-            now = time.time()
+            now = self._state._clock()
 
             # Check if the cooling period was already served before this restart
             if last_loss_ts is not None and (now - last_loss_ts) >= cooling_window_sec:
@@ -398,8 +411,8 @@ class KillSwitch:
         hard = "⚠️  HARD STOPPED" if s._hard_stop else "OK"
         daily = f"${s._daily_loss_usd:.2f} / ${s.starting_bankroll * DAILY_LOSS_LIMIT_PCT:.2f} limit"
 
-        if s._cooling_until and time.time() < s._cooling_until:
-            remaining = (s._cooling_until - time.time()) / 60
+        if s._cooling_until and s._clock() < s._cooling_until:
+            remaining = (s._cooling_until - s._clock()) / 60
             consec = f"{s._consecutive_losses}/{CONSECUTIVE_LOSS_LIMIT} ⚠️  COOLING {remaining:.0f}min remaining"
         else:
             consec = f"{s._consecutive_losses}/{CONSECUTIVE_LOSS_LIMIT} — OK"
@@ -411,7 +424,7 @@ class KillSwitch:
             f"  Consecutive:     {consec}",
             "════════════════════════════════════════════",
         ]
-        if s._hard_stop or (s._cooling_until and time.time() < s._cooling_until):
+        if s._hard_stop or (s._cooling_until and s._clock() < s._cooling_until):
             for line in lines:
                 logger.warning(line)
         else:
@@ -466,7 +479,7 @@ class KillSwitch:
 
         self._state._hard_stop = True
         self._state._hard_stop_reason = reason
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = self._state._utcnow().isoformat()
 
         logger.critical("🚨 HARD STOP TRIGGERED: %s", reason)
 
@@ -517,10 +530,9 @@ class KillSwitch:
         """Write to BLOCKERS.md when auth failures halt the bot. Skipped during tests."""
         if os.environ.get("PYTEST_CURRENT_TEST"):
             return  # Don't pollute BLOCKERS.md with expected test-triggered auth failures
-        blockers_path = PROJECT_ROOT / "BLOCKERS.md"
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = self._state._utcnow().isoformat()
         try:
-            with open(blockers_path, "a") as f:
+            with open(BLOCKERS_FILE, "a") as f:
                 f.write(f"\n## BLOCKER: Auth failure halt — {timestamp}\n")
                 f.write(f"Severity: CRITICAL\n")
                 f.write(f"Need: Kalshi auth failing — {reason}\n")
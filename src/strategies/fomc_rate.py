@@ -46,7 +46,7 @@ import re
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from src.strategies.base import BaseStrategy, Signal
 from src.platforms.kalshi import Market, OrderBook
@@ -223,6 +223,7 @@ class FOMCRateStrategy(BaseStrategy):
         days_before_meeting: int = _DEFAULT_DAYS_BEFORE_MEETING,
         spread_hold_band: float = _DEFAULT_SPREAD_HOLD_BAND,
         cpi_adjustment: float = _DEFAULT_CPI_ADJUSTMENT,
+        days_until_fomc_fn: Callable[[], Optional[int]] = days_until_fomc,
     ):
         self._fred = fred_feed
         self._min_edge_pct = min_edge_pct
@@ -230,6 +231,7 @@ class FOMCRateStrategy(BaseStrategy):
         self._days_before_meeting = days_before_meeting
         self._spread_hold_band = spread_hold_band
         self._cpi_adjustment = cpi_adjustment
+        self._days_until_fomc = days_until_fomc_fn  # injectable for tests
 
     @property
     def name(self) -> str:
@@ -244,7 +246,7 @@ class FOMCRateStrategy(BaseStrategy):
         """Evaluate FOMC model vs Kalshi KXFEDDECISION market price."""
 
         # ── 1. FOMC timing gate ───────────────────────────────────────
-        days_away = days_until_fomc()
+        days_away = self._days_until_fomc()
         if days_away is None or days_away > self._days_before_meeting:
             logger.debug(
                 "[fomc] Next meeting %d days away (window=%d) — skip %s",
@@ -0,0 +1,43 @@
+"""
+_db_helpers.py — trade seeding for the DB tests
+(tests/test_db.py, tests/test_db_graduation.py, tests/test_graduation_reporter.py).
+
+Plain module (not test_*.py, not conftest), so it is imported like any other
+module. TradeRow / insert_trade_rows are the one raw-INSERT path DB tests seed
+through; the DB fixtures themselves live in conftest.py.
+"""
+
+import time
+from collections import namedtuple
+
+
+TradeRow = namedtuple(
+    "TradeRow",
+    "timestamp ticker side action price_cents count cost_usd "
+    "strategy edge_pct win_prob is_paper result pnl_cents settled_at",
+    defaults=(None, "KXBTC15M-TEST", "yes", "buy", 50, 1, 0.50,
+              "btc_lag", None, None, 1, None, None, None),
+)
+TradeRow.__doc__ = """
+One trades row for insert_trade_rows(). Override only what a test cares about.
+
+timestamp=None means "now"; settled_at=None on a settled row (result set)
+means "same as timestamp". is_paper is stored as-is (1=paper, 0=live).
+"""
+
+_INSERT_TRADE_ROW_SQL = f"""INSERT INTO trades ({", ".join(TradeRow._fields)})
+    VALUES ({", ".join("?" * len(TradeRow._fields))})"""
+
+
+def insert_trade_rows(db, rows) -> None:
+    """Insert TradeRows bypassing save_trade(), in one executemany + one commit."""
+    now = time.time()
+    params = []
+    for row in rows:
+        if row.timestamp is None:
+            row = row._replace(timestamp=now)
+        if row.result is not None and row.settled_at is None:
+            row = row._replace(settled_at=row.timestamp)
+        params.append(row)
+    with db._conn:
+        db._conn.executemany(_INSERT_TRADE_ROW_SQL, params)
@@ -0,0 +1,121 @@
+"""
+_drift_helpers.py — input builders for the btc_drift tests
+(tests/test_drift_strategy.py, tests/test_eth_support.py).
+
+Plain module (not test_*.py), so pytest neither collects it nor applies its
+assertion rewriting to it. Everything here is read-only shared state: cached
+Market instances, one empty OrderBook, a cheap BinanceFeed stub, and the
+frozen clock those markets are built against.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import pytest
+
+from src.platforms.kalshi import Market, OrderBook
+from src.strategies import btc_drift
+
+# One clock for both sides: markets are built relative to NOW, and the drift
+# tests patch FrozenDatetime into btc_drift so the strategy's "now" is NOW too.
+# Gate boundaries (e.g. 3.0 vs 3.1 min remaining) then hold exactly, however
+# long the run takes. pin_now() re-pins it when the drift tests start.
+NOW = datetime.now(timezone.utc)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return NOW.astimezone(tz) if tz is not None else NOW.replace(tzinfo=None)
+
+
+def pin_now() -> None:
+    """Reset NOW to the current time and drop everything cached against the old value."""
+    global NOW
+    NOW = datetime.now(timezone.utc)
+    _iso_offsets.cache_clear()
+    _cached_market.cache_clear()
+
+
+@contextmanager
+def frozen_drift_clock():
+    """Re-pin NOW and freeze btc_drift's datetime.now() at it until exit."""
+    pin_now()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(btc_drift, "datetime", FrozenDatetime)
+        yield
+
+
+@lru_cache(maxsize=64)
+def _iso_offsets(minutes_remaining: float, minutes_since_open: float) -> tuple:
+    """(close_time, open_time) ISO strings relative to NOW."""
+    return (
+        (NOW + timedelta(minutes=minutes_remaining)).isoformat(),
+        (NOW - timedelta(minutes=minutes_since_open)).isoformat(),
+    )
+
+
+def make_market(
+    ticker: str = "KXBTC15M-TEST",
+    yes_price: int = 50,
+    no_price: int = 50,
+    minutes_remaining: float = 10.0,
+    minutes_since_open: float = 5.0,
+    status: str = "open",
+    event_ticker: str = "KXBTC15M",
+) -> Market:
+    # Resolve defaults before the cache lookup, so make_market() and
+    # make_market(yes_price=50, no_price=50) hit the same entry.
+    return _cached_market(
+        ticker, yes_price, no_price, float(minutes_remaining),
+        float(minutes_since_open), status, event_ticker,
+    )
+
+
+# Memoized: btc_drift only reads Market fields, so equal shapes share one
+# instance (test_generate_signal_does_not_mutate_market guards that).
+@lru_cache(maxsize=32)
+def _cached_market(
+    ticker, yes_price, no_price, minutes_remaining, minutes_since_open, status, event_ticker,
+) -> Market:
+    close_time, open_time = _iso_offsets(minutes_remaining, minutes_since_open)
+    return Market(
+        ticker=ticker,
+        title="Test market",
+        event_ticker=event_ticker,
+        status=status,
+        yes_price=yes_price,
+        no_price=no_price,
+        volume=1000,
+        close_time=close_time,
+        open_time=open_time,
+        result=None,
+        raw={},
+    )
+
+
+# btc_drift never reads the orderbook, so every test shares one empty book.
+# Tuples, not lists: a stray append on the shared instance fails loudly.
+EMPTY_OB = OrderBook(yes_bids=(), no_bids=())
+
+
+class StubFeed:
+    """Just the two BinanceFeed members btc_drift reads — far cheaper than a MagicMock."""
+
+    __slots__ = ("is_stale", "_p")
+
+    def __init__(self, price, stale: bool = False):
+        self.is_stale = stale
+        self._p = price
+
+    def current_price(self):
+        return self._p
+
+
+def make_btc_feed(current_price=50000.0, is_stale: bool = False) -> StubFeed:
+    return StubFeed(current_price, is_stale)
@@ -3,23 +3,144 @@ conftest.py — session-level fixtures shared across all test files.
 
 Ensures kill_switch.lock is always clean at the start and end of a test run,
 even if a previous run was interrupted (Ctrl+C, SIGKILL, etc.).
+
+Also builds the SQLite schema once per session (db_template) so DB tests can
+clone it instead of re-running DDL + migrations for every test.
+
+Fixtures and hooks only — shared plain helpers live in _*_helpers.py modules.
 """
 
+import shutil
+import sqlite3
+
 import pytest
+from src.db import DB
 from src.risk.kill_switch import LOCK_FILE
 
 
-@pytest.fixture(scope="session", autouse=True)
-def clean_lock_file_at_session_start():
+def _is_xdist_worker(session) -> bool:
+    return hasattr(session.config, "workerinput")
+
+
+def pytest_sessionstart(session):
     """
     Remove any stale kill_switch.lock at the start of a test session.
 
     Without this, an interrupted previous test run can leave a lock file
     that causes `python main.py` to refuse startup after `pytest`.
+
+    Under pytest-xdist only the controller cleans up: it runs before any worker
+    starts and after all have finished, so it can never delete a lock file a
+    kill switch test on another worker has just written.
     """
-    if LOCK_FILE.exists():
+    if not _is_xdist_worker(session) and LOCK_FILE.exists():
         LOCK_FILE.unlink()
-    yield
+
+
+def pytest_sessionfinish(session, exitstatus):
     # Also clean up at session end for good measure
-    if LOCK_FILE.exists():
+    if not _is_xdist_worker(session) and LOCK_FILE.exists():
         LOCK_FILE.unlink()
+
+
+@pytest.fixture
+def tmp_lock_file(tmp_path, monkeypatch):
+    """
+    Point kill_switch.LOCK_FILE at a not-yet-existing file under tmp_path.
+
+    For tests that only need "no lock present": they start clean without
+    stat()ing or deleting the real kill_switch.lock, and cannot race other
+    xdist workers over it.
+    """
+    from src.risk import kill_switch
+    path = tmp_path / "kill_switch.lock"
+    monkeypatch.setattr(kill_switch, "LOCK_FILE", path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def db_template():
+    """
+    In-memory DB with the full schema and migrations applied, built once.
+
+    Per-test fixtures clone it with sqlite3's backup API (a page copy) rather
+    than calling DB.init() again. Never write to this DB directly.
+    """
+    template = DB(":memory:")
+    template.init()
+    yield template
+    template.close()
+
+
+@pytest.fixture(scope="session")
+def clone_db(db_template):
+    """
+    Factory returning a new in-memory DB copied from db_template.
+
+    Callers own the returned DB and must close() it.
+    """
+    def _clone() -> DB:
+        db = DB(":memory:")
+        db._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        db._conn.row_factory = sqlite3.Row
+        db_template._conn.backup(db._conn)
+        return db
+    return _clone
+
+
+@pytest.fixture(scope="session")
+def db_template_file(db_template, tmp_path_factory):
+    """db_template written to disk once per session — copy it, never open it in place."""
+    path = tmp_path_factory.mktemp("db_template") / "schema.db"
+    dest = sqlite3.connect(str(path))
+    db_template._conn.backup(dest)
+    dest.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def copy_db_file(db_template_file):
+    """
+    Factory: copy the on-disk schema template to `path` and open it as a DB.
+
+    For tests that need a real file. A file copy replaces re-running DDL.
+    Callers own the returned DB and must close() it.
+    """
+    def _copy(path) -> DB:
+        shutil.copyfile(db_template_file, path)
+        db = DB(path)
+        db._conn = sqlite3.connect(str(path), check_same_thread=False)
+        db._conn.row_factory = sqlite3.Row
+        return db
+    return _copy
+
+
+# Empties every table and restarts AUTOINCREMENT ids — a fresh-DB equivalent.
+_RESET_DB_SQL = """
+DELETE FROM trades;
+DELETE FROM daily_pnl;
+DELETE FROM bankroll_history;
+DELETE FROM kill_switch_events;
+DELETE FROM sqlite_sequence;
+"""
+
+
+@pytest.fixture(scope="session")
+def _session_db(clone_db):
+    db = clone_db()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def reset_db(_session_db):
+    """
+    One long-lived in-memory DB per session (per xdist worker), emptied after each test.
+
+    Uncommitted work is rolled back first, then every table is cleared, so the
+    next test sees the same state as a fresh clone without opening a connection.
+    """
+    yield _session_db
+    conn = _session_db._conn
+    conn.rollback()
+    conn.executescript(_RESET_DB_SQL)
@@ -1,36 +1,55 @@
 """
 Tests for src/db.py — SQLite persistence layer.
 
-Uses a temporary in-memory (or tempfile) DB for isolation.
+Each test gets an empty in-memory DB (conftest.reset_db — one connection,
+cleared between tests). disk_db is reserved for tests that must hit a file.
 No mocking of sqlite3 — we test the real SQL.
 """
 
 from __future__ import annotations
 
 import csv
+import sqlite3
 import tempfile
 import time
 from pathlib import Path
 
 import pytest
 
-from src.db import DB
+from _db_helpers import TradeRow, insert_trade_rows
+
+
+# Disk DBs are thrown away at teardown — durability buys nothing, so skip fsync.
+_TEST_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=OFF;
+PRAGMA temp_store=MEMORY;
+PRAGMA locking_mode=EXCLUSIVE;
+"""
 
 
 # ── Fixtures ──────────────────────────────────────────────────────
 
 
 @pytest.fixture
-def db(tmp_path):
-    """Fresh DB in a temp directory per test."""
-    d = DB(tmp_path / "test.db")
-    d.init()
+def db(reset_db):
+    """Empty in-memory DB per test — the session DB, reset at teardown."""
+    return reset_db
+
+
+@pytest.fixture
+def disk_db(tmp_path, copy_db_file):
+    """Fresh on-disk DB (copied from the schema template file) — only for tests guarding real file I/O."""
+    d = copy_db_file(tmp_path / "test.db")
+    d._conn.executescript(_TEST_PRAGMAS)
     yield d
     d.close()
 
 
 def _save_trade(db, *, ticker="KXBTC15M-TEST", side="yes", price_cents=44,
-                count=10, cost_usd=4.40, is_paper=True, strategy="btc_lag"):
+                count=10, cost_usd=4.40, is_paper=True, strategy="btc_lag",
+                edge_pct=0.12, win_prob=0.62):
+    """Place a buy through the real DB.save_trade() API. Returns the trade id."""
     return db.save_trade(
         ticker=ticker,
         side=side,
@@ -39,12 +58,21 @@ def _save_trade(db, *, ticker="KXBTC15M-TEST", side="yes", price_cents=44,
         count=count,
         cost_usd=cost_usd,
         strategy=strategy,
-        edge_pct=0.12,
-        win_prob=0.62,
+        edge_pct=edge_pct,
+        win_prob=win_prob,
         is_paper=is_paper,
     )
 
 
+def _save_live_trade(db, ticker="KXBTC15M-T", side="yes", price_cents=50):
+    """$5 / 100-contract live btc_lag_v1 bet via save_trade()."""
+    return _save_trade(
+        db, ticker=ticker, side=side, price_cents=price_cents, count=100,
+        cost_usd=5.0, is_paper=False, strategy="btc_lag_v1",
+        edge_pct=0.05, win_prob=0.6,
+    )
+
+
 # ── Bankroll ──────────────────────────────────────────────────────
 
 
@@ -52,9 +80,10 @@ class TestBankroll:
     def test_latest_bankroll_none_if_empty(self, db):
         assert db.latest_bankroll() is None
 
-    def test_save_and_retrieve_bankroll(self, db):
-        db.save_bankroll(50.0, source="api")
-        assert db.latest_bankroll() == 50.0
+    def test_save_and_retrieve_bankroll(self, disk_db):
+        """Runs against a real file so on-disk I/O regressions still surface."""
+        disk_db.save_bankroll(50.0, source="api")
+        assert disk_db.latest_bankroll() == 50.0
 
     def test_latest_bankroll_returns_most_recent(self, db):
         db.save_bankroll(50.0, source="api")
@@ -68,6 +97,13 @@ class TestBankroll:
         assert len(history) == 5
 
 
+class TestDiskTemplate:
+    def test_copied_file_has_migrated_schema(self, disk_db):
+        """The template file must carry migrations too, since disk_db skips init()."""
+        cols = {r[1] for r in disk_db._conn.execute("PRAGMA table_info(trades)")}
+        assert {"signal_price_cents", "close_price_cents", "signal_features"} <= cols
+
+
 # ── Trades — save + retrieve ──────────────────────────────────────
 
 
@@ -107,13 +143,18 @@ class TestSaveTrade:
 # ── Settlement ────────────────────────────────────────────────────
 
 
+def _fetch_trade(db, trade_id) -> sqlite3.Row:
+    """Read one trade row by id — cheaper than get_trades() for field checks."""
+    return db._conn.execute("SELECT * FROM trades WHERE id = ?", (trade_id,)).fetchone()
+
+
 class TestSettleTrade:
     def test_settle_sets_result(self, db):
         trade_id = _save_trade(db, side="yes")
         db.settle_trade(trade_id, result="yes", pnl_cents=560)
-        trades = db.get_trades()
-        assert trades[0]["result"] == "yes"
-        assert trades[0]["pnl_cents"] == 560
+        row = _fetch_trade(db, trade_id)
+        assert row["result"] == "yes"
+        assert row["pnl_cents"] == 560
 
     def test_settled_trade_not_in_open_trades(self, db):
         trade_id = _save_trade(db)
@@ -124,27 +165,23 @@ class TestSettleTrade:
     def test_loss_settlement_negative_pnl(self, db):
         trade_id = _save_trade(db, side="yes", price_cents=44, count=10)
         db.settle_trade(trade_id, result="no", pnl_cents=-440)
-        trades = db.get_trades()
-        assert trades[0]["pnl_cents"] == -440
+        assert _fetch_trade(db, trade_id)["pnl_cents"] == -440
 
     def test_settle_stores_close_price_cents(self, db):
         trade_id = _save_trade(db, side="yes", price_cents=92)
         db.settle_trade(trade_id, result="yes", pnl_cents=800, close_price_cents=95)
-        trades = db.get_trades()
-        assert trades[0]["close_price_cents"] == 95
+        assert _fetch_trade(db, trade_id)["close_price_cents"] == 95
 
     def test_settle_close_price_none_when_omitted(self, db):
         trade_id = _save_trade(db, side="yes")
         db.settle_trade(trade_id, result="yes", pnl_cents=600)
-        trades = db.get_trades()
-        assert trades[0]["close_price_cents"] is None
+        assert _fetch_trade(db, trade_id)["close_price_cents"] is None
 
     def test_settle_close_price_null_for_collapsed_price(self, db):
         """Price collapsed to 1c (post-finalization) should be stored as NULL."""
         trade_id = _save_trade(db, side="yes", price_cents=92)
         db.settle_trade(trade_id, result="yes", pnl_cents=800, close_price_cents=None)
-        trades = db.get_trades()
-        assert trades[0]["close_price_cents"] is None
+        assert _fetch_trade(db, trade_id)["close_price_cents"] is None
 
 
 # ── Win rate ──────────────────────────────────────────────────────
@@ -155,19 +192,18 @@ class TestWinRate:
         _save_trade(db)
         assert db.win_rate() is None
 
-    def test_win_rate_100_pct_all_wins(self, db):
-        # Bet YES, market resolves YES → win
-        for _ in range(3):
-            t = _save_trade(db, side="yes")
-            db.settle_trade(t, result="yes", pnl_cents=560)
-        assert db.win_rate() == pytest.approx(1.0)
-
-    def test_win_rate_0_pct_all_losses(self, db):
-        # Bet YES, market resolves NO → loss
-        for _ in range(3):
-            t = _save_trade(db, side="yes")
-            db.settle_trade(t, result="no", pnl_cents=-440)
-        assert db.win_rate() == pytest.approx(0.0)
+    @pytest.mark.parametrize("side,result,expected", [
+        ("yes", "yes", 1.0),  # bet YES, market resolves YES → win
+        ("yes", "no", 0.0),   # bet YES, market resolves NO → loss
+        # Critical regression for the bug we fixed: betting NO and winning
+        # (result=="no"==side) must count as a WIN, and losing as a LOSS.
+        ("no", "no", 1.0),
+        ("no", "yes", 0.0),
+    ], ids=["yes_win", "yes_loss", "no_win", "no_loss"])
+    def test_win_rate_single_outcome(self, db, side, result, expected):
+        t = _save_trade(db, side=side)
+        db.settle_trade(t, result=result, pnl_cents=500 if side == result else -500)
+        assert db.win_rate() == expected
 
     def test_win_rate_50_pct_mixed(self, db):
         t1 = _save_trade(db, side="yes")
@@ -176,19 +212,6 @@ class TestWinRate:
         db.settle_trade(t2, result="no", pnl_cents=-440)  # loss
         assert db.win_rate() == pytest.approx(0.5)
 
-    def test_win_rate_correct_for_no_side_wins(self, db):
-        # Critical regression test for the bug we fixed:
-        # Betting NO and winning (result=="no"==side) must count as a WIN.
-        t = _save_trade(db, side="no", price_cents=56)
-        db.settle_trade(t, result="no", pnl_cents=440)  # won
-        assert db.win_rate() == pytest.approx(1.0)
-
-    def test_win_rate_correct_for_no_side_loss(self, db):
-        # Betting NO and losing (result=="yes"!=side) must count as a LOSS.
-        t = _save_trade(db, side="no", price_cents=56)
-        db.settle_trade(t, result="yes", pnl_cents=-560)  # lost
-        assert db.win_rate() == pytest.approx(0.0)
-
     def test_win_rate_mixed_yes_and_no_sides(self, db):
         # YES bet, wins
         t1 = _save_trade(db, side="yes")
@@ -221,7 +244,7 @@ class TestWinRate:
 class TestTotalPnL:
     def test_total_pnl_zero_if_no_settled(self, db):
         _save_trade(db)
-        assert db.total_realized_pnl_usd() == pytest.approx(0.0)
+        assert db.total_realized_pnl_cents() == 0
 
     def test_total_pnl_sums_correctly(self, db):
         t1 = _save_trade(db)
@@ -229,12 +252,28 @@ class TestTotalPnL:
         t2 = _save_trade(db)
         db.settle_trade(t2, result="no", pnl_cents=-440)  # -$4.40
         # net = +1.20
-        assert db.total_realized_pnl_usd() == pytest.approx(1.20)
+        assert db.total_realized_pnl_cents() == 120
 
     def test_total_pnl_negative_when_losing(self, db):
         t = _save_trade(db)
         db.settle_trade(t, result="no", pnl_cents=-440)
-        assert db.total_realized_pnl_usd() == pytest.approx(-4.40)
+        assert db.total_realized_pnl_cents() == -440
+
+    def test_total_pnl_cents_respects_paper_filter(self, db):
+        t1 = _save_trade(db, is_paper=True)
+        db.settle_trade(t1, result="yes", pnl_cents=560)
+        t2 = _save_trade(db, is_paper=False)
+        db.settle_trade(t2, result="no", pnl_cents=-440)
+        assert db.total_realized_pnl_cents(is_paper=True) == 560
+        assert db.total_realized_pnl_cents(is_paper=False) == -440
+
+    def test_total_pnl_usd(self, db):
+        t1 = _save_trade(db, is_paper=True)
+        db.settle_trade(t1, result="yes", pnl_cents=560)  # +$5.60
+        t2 = _save_trade(db, is_paper=False)
+        db.settle_trade(t2, result="no", pnl_cents=-445)  # -$4.45
+        assert db.total_realized_pnl_usd() == pytest.approx(1.15)
+        assert db.total_realized_pnl_usd(is_paper=False) == pytest.approx(-4.45)
 
 
 # ── Kill switch events ────────────────────────────────────────────
@@ -250,73 +289,69 @@ class TestKillSwitchEvents:
         assert events[0]["bankroll_at_trigger"] == pytest.approx(40.0)
 
     def test_events_ordered_newest_first(self, db):
-        db.save_kill_switch_event("soft_stop", "First")
-        time.sleep(0.01)
-        db.save_kill_switch_event("hard_stop", "Second")
+        db.save_kill_switch_event("soft_stop", "First", ts=1000.0)
+        db.save_kill_switch_event("hard_stop", "Second", ts=1001.0)
         events = db.get_kill_switch_events()
         assert events[0]["trigger_type"] == "hard_stop"
 
 
 # ── Dashboard DB path resolution ──────────────────────────────────
 
+@pytest.fixture(scope="class")
+def dashboard_module():
+    """Import src.dashboard once per class with streamlit mocked out.
+
+    The module is only dropped from sys.modules at class teardown, so tests
+    share a single import instead of re-executing its top-level code each time.
+    """
+    import sys
+    from unittest.mock import MagicMock
+    mocks = {
+        "streamlit": MagicMock(),
+        "streamlit_autorefresh": MagicMock(),
+    }
+    with pytest.MonkeyPatch.context() as mp:
+        for name, mock in mocks.items():
+            if name not in sys.modules:
+                mp.setitem(sys.modules, name, mock)
+        import src.dashboard as dash
+        yield dash
+        sys.modules.pop("src.dashboard", None)
+
+
 class TestDashboardDbPath:
     """Verify _resolve_db_path reads config.yaml and falls back gracefully.
 
     streamlit is not installed in the test environment, so we mock it before
     importing src.dashboard — this avoids an ImportError while still exercising
-    the pure-Python _resolve_db_path function.
+    the pure-Python _resolve_db_path function. _resolve_db_path reads
+    PROJECT_ROOT on every call, so patching it is enough — no reload needed.
     """
 
-    @pytest.fixture(autouse=True)
-    def mock_streamlit(self, monkeypatch):
-        """Inject a mock streamlit so src.dashboard can be imported without it installed."""
-        import sys
-        from unittest.mock import MagicMock
-        mock_st = MagicMock()
-        mocks = {
-            "streamlit": mock_st,
-            "streamlit_autorefresh": MagicMock(),
-        }
-        with pytest.MonkeyPatch.context() as mp:
-            for name, mock in mocks.items():
-                if name not in sys.modules:
-                    mp.setitem(sys.modules, name, mock)
-            yield
-            # Remove cached dashboard module so next test gets a fresh import
-            sys.modules.pop("src.dashboard", None)
-
-    def test_resolve_returns_absolute_path(self):
-        from src.dashboard import _resolve_db_path
-        path = _resolve_db_path()
+    def test_resolve_returns_absolute_path(self, dashboard_module):
+        path = dashboard_module._resolve_db_path()
         assert path.is_absolute()
 
-    def test_resolve_points_to_config_value(self):
+    def test_resolve_points_to_config_value(self, dashboard_module):
         """Should return data/polybot.db (as configured in config.yaml)."""
-        from src.dashboard import _resolve_db_path
-        path = _resolve_db_path()
+        path = dashboard_module._resolve_db_path()
         assert path.name == "polybot.db"
         assert "data" in path.parts
 
-    def test_resolve_fallback_on_bad_config(self, tmp_path):
+    def test_resolve_fallback_on_bad_config(self, dashboard_module, tmp_path):
         """Malformed config.yaml should fall back gracefully, not raise."""
-        import sys
+        import unittest.mock as mock
         bad_config = tmp_path / "config.yaml"
         bad_config.write_text("{ invalid yaml: [")
-        sys.modules.pop("src.dashboard", None)
-        import src.dashboard as dash
-        import unittest.mock as mock
-        with mock.patch.object(dash, "PROJECT_ROOT", tmp_path):
-            path = dash._resolve_db_path()
+        with mock.patch.object(dashboard_module, "PROJECT_ROOT", tmp_path):
+            path = dashboard_module._resolve_db_path()
         assert isinstance(path, Path)
 
-    def test_resolve_fallback_on_missing_config(self, tmp_path):
+    def test_resolve_fallback_on_missing_config(self, dashboard_module, tmp_path):
         """Missing config.yaml should fall back gracefully, not raise."""
-        import sys
-        sys.modules.pop("src.dashboard", None)
-        import src.dashboard as dash
         import unittest.mock as mock
-        with mock.patch.object(dash, "PROJECT_ROOT", tmp_path):
-            path = dash._resolve_db_path()
+        with mock.patch.object(dashboard_module, "PROJECT_ROOT", tmp_path):
+            path = dashboard_module._resolve_db_path()
         assert isinstance(path, Path)
 
 
@@ -329,15 +364,11 @@ class TestCountTradesToday:
     def _save_with_ts(self, db, timestamp: float, strategy: str = "btc_lag",
                       is_paper: bool = True):
         """Insert a trade row with a custom timestamp (bypasses save_trade's time.time())."""
-        db._conn.execute(
-            """INSERT INTO trades
-               (timestamp, ticker, side, action, price_cents, count, cost_usd,
-                strategy, edge_pct, win_prob, is_paper)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (timestamp, "TEST-001", "yes", "buy", 44, 10, 4.40,
-             strategy, 0.12, 0.62, int(is_paper)),
-        )
-        db._conn.commit()
+        insert_trade_rows(db, [TradeRow(
+            timestamp=timestamp, ticker="TEST-001", price_cents=44, count=10,
+            cost_usd=4.40, strategy=strategy, edge_pct=0.12, win_prob=0.62,
+            is_paper=int(is_paper),
+        )])
 
     def test_zero_when_empty(self, db):
         assert db.count_trades_today("btc_lag") == 0
@@ -409,6 +440,9 @@ class TestCountTradesToday:
 # ── has_open_position ─────────────────────────────────────────────
 
 
+_OPEN_TICKER = "KXBTC15M-TEST"
+
+
 class TestHasOpenPosition:
     """has_open_position() returns True when an unsettled trade exists on ticker."""
 
@@ -428,19 +462,17 @@ class TestHasOpenPosition:
         _save_trade(db, ticker="KXBTC15M-001")
         assert db.has_open_position("KXBTC15M-002") is False
 
-    def test_paper_filter_true(self, db):
-        _save_trade(db, ticker="KXBTC15M-TEST", is_paper=True)
-        assert db.has_open_position("KXBTC15M-TEST", is_paper=True) is True
-        assert db.has_open_position("KXBTC15M-TEST", is_paper=False) is False
-
-    def test_paper_filter_false(self, db):
-        _save_trade(db, ticker="KXBTC15M-TEST", is_paper=False)
-        assert db.has_open_position("KXBTC15M-TEST", is_paper=False) is True
-        assert db.has_open_position("KXBTC15M-TEST", is_paper=True) is False
-
-    def test_no_filter_matches_both(self, db):
-        _save_trade(db, ticker="KXBTC15M-TEST", is_paper=True)
-        assert db.has_open_position("KXBTC15M-TEST") is True
+    @pytest.mark.parametrize("saved,query,expected", [
+        (True, True, True),
+        (True, False, False),
+        (True, None, True),
+        (False, True, False),
+        (False, False, True),
+        (False, None, True),
+    ])
+    def test_paper_filter(self, db, saved, query, expected):
+        _save_trade(db, ticker=_OPEN_TICKER, is_paper=saved)
+        assert db.has_open_position(_OPEN_TICKER, is_paper=query) is expected
 
     def test_multiple_open_positions_same_ticker(self, db):
         """Two unsettled bets on same ticker → still returns True (any open)."""
@@ -507,8 +539,7 @@ class TestExportTradesCsv:
         out = tmp_path / "out.csv"
         db.export_trades_csv(out)
         with open(out) as f:
-            rows = list(csv.DictReader(f))
-        assert len(rows) == 3
+            assert sum(1 for _ in f) - 1 == 3  # minus header row
 
     def test_is_paper_label(self, db, tmp_path):
         _save_trade(db, is_paper=True)
@@ -516,8 +547,7 @@ class TestExportTradesCsv:
         out = tmp_path / "out.csv"
         db.export_trades_csv(out)
         with open(out) as f:
-            rows = list(csv.DictReader(f))
-        labels = {r["is_paper"] for r in rows}
+            labels = {r["is_paper"] for r in csv.DictReader(f)}
         assert "paper" in labels
         assert "live" in labels
 
@@ -527,8 +557,7 @@ class TestExportTradesCsv:
         out = tmp_path / "out.csv"
         db.export_trades_csv(out)
         with open(out) as f:
-            rows = list(csv.DictReader(f))
-        row = rows[0]
+            row = next(csv.DictReader(f))
         assert row["result"] == "no"
         assert float(row["pnl_usd"]) == 3.5
         assert row["won"] == "True"
@@ -538,9 +567,9 @@ class TestExportTradesCsv:
         out = tmp_path / "out.csv"
         db.export_trades_csv(out)
         with open(out) as f:
-            rows = list(csv.DictReader(f))
-        assert rows[0]["pnl_usd"] == ""
-        assert rows[0]["won"] == ""
+            row = next(csv.DictReader(f))
+        assert row["pnl_usd"] == ""
+        assert row["won"] == ""
 
     def test_overwrites_on_second_call(self, db, tmp_path):
         _save_trade(db)
@@ -549,8 +578,7 @@ class TestExportTradesCsv:
         _save_trade(db, ticker="KXBTC15M-B")
         db.export_trades_csv(out)
         with open(out) as f:
-            rows = list(csv.DictReader(f))
-        assert len(rows) == 2
+            assert sum(1 for _ in f) - 1 == 2  # minus header row
 
     def test_creates_parent_dir(self, db, tmp_path):
         out = tmp_path / "subdir" / "nested" / "out.csv"
@@ -565,13 +593,6 @@ class TestExportTradesCsv:
 class TestDailyLiveLossUsd:
     """daily_live_loss_usd() returns today's settled live losses as a positive USD amount."""
 
-    def _live_trade(self, db, ticker="KXBTC15M-T", side="yes", price_cents=50):
-        return db.save_trade(
-            ticker=ticker, side=side, action="buy", price_cents=price_cents,
-            count=100, cost_usd=5.0, is_paper=False,
-            strategy="btc_lag_v1", edge_pct=0.05, win_prob=0.6,
-        )
-
     def test_returns_zero_if_no_settled_trades(self, db):
         assert db.daily_live_loss_usd() == pytest.approx(0.0)
 
@@ -585,18 +606,18 @@ class TestDailyLiveLossUsd:
         assert db.daily_live_loss_usd() == pytest.approx(0.0)
 
     def test_counts_live_losses(self, db):
-        t = self._live_trade(db)
+        t = _save_live_trade(db)
         db.settle_trade(t, result="no", pnl_cents=-500)  # $5 loss
         assert db.daily_live_loss_usd() == pytest.approx(5.0)
 
     def test_excludes_live_wins(self, db):
-        t = self._live_trade(db)
+        t = _save_live_trade(db)
         db.settle_trade(t, result="yes", pnl_cents=560)  # win
         assert db.daily_live_loss_usd() == pytest.approx(0.0)
 
     def test_sums_multiple_live_losses(self, db):
-        t1 = self._live_trade(db, ticker="KXBTC15M-A")
-        t2 = self._live_trade(db, ticker="KXBTC15M-B")
+        t1 = _save_live_trade(db, ticker="KXBTC15M-A")
+        t2 = _save_live_trade(db, ticker="KXBTC15M-B")
         db.settle_trade(t1, result="no", pnl_cents=-500)  # $5 loss
         db.settle_trade(t2, result="no", pnl_cents=-480)  # $4.80 loss
         assert db.daily_live_loss_usd() == pytest.approx(9.80, abs=0.01)
@@ -614,7 +635,7 @@ class TestDailyLiveLossUsd:
         midnight_cst = now_cst.replace(hour=0, minute=0, second=0, microsecond=0)
         three_hours_before_midnight = (midnight_cst - timedelta(hours=3)).timestamp()
 
-        t = self._live_trade(db)
+        t = _save_live_trade(db)
         # Manually settle with yesterday-CST timestamp
         db._conn.execute(
             "UPDATE trades SET result='no', pnl_cents=-500, settled_at=? WHERE id=?",
@@ -632,7 +653,7 @@ class TestDailyLiveLossUsd:
         midnight_cst = now_cst.replace(hour=0, minute=0, second=0, microsecond=0)
         one_hour_after_midnight = (midnight_cst + timedelta(hours=1)).timestamp()
 
-        t = self._live_trade(db)
+        t = _save_live_trade(db)
         db._conn.execute(
             "UPDATE trades SET result='no', pnl_cents=-500, settled_at=? WHERE id=?",
             (one_hour_after_midnight, t),
@@ -653,13 +674,6 @@ class TestAllTimeLiveLossUsd:
     hard stops on bots that have had wins offsetting their losses.
     """
 
-    def _live_trade(self, db, ticker="KXBTC15M-T", side="yes", price_cents=50):
-        return db.save_trade(
-            ticker=ticker, side=side, action="buy", price_cents=price_cents,
-            count=100, cost_usd=5.0, is_paper=False,
-            strategy="btc_lag_v1", edge_pct=0.05, win_prob=0.6,
-        )
-
     def test_returns_zero_if_no_settled_trades(self, db):
         assert db.all_time_live_loss_usd() == pytest.approx(0.0)
 
@@ -675,34 +689,34 @@ class TestAllTimeLiveLossUsd:
 
     def test_net_loss_only_trades(self, db):
         """Net loss when all live trades are losses."""
-        t = self._live_trade(db)
+        t = _save_live_trade(db)
         db.settle_trade(t, result="no", pnl_cents=-500)  # $5 loss
         assert db.all_time_live_loss_usd() == pytest.approx(5.0)
 
     def test_returns_zero_when_only_wins(self, db):
         """Net loss is 0 when all live trades are wins."""
-        t = self._live_trade(db)
+        t = _save_live_trade(db)
         db.settle_trade(t, result="yes", pnl_cents=560)  # $5.60 win
         assert db.all_time_live_loss_usd() == pytest.approx(0.0)
 
     def test_returns_zero_when_profitable_overall(self, db):
         """Wins offsetting losses → net positive → return 0 (not negative)."""
-        t1 = self._live_trade(db, ticker="KXBTC15M-A")
-        t2 = self._live_trade(db, ticker="KXBTC15M-B")
+        t1 = _save_live_trade(db, ticker="KXBTC15M-A")
+        t2 = _save_live_trade(db, ticker="KXBTC15M-B")
         db.settle_trade(t1, result="no", pnl_cents=-500)   # $5 loss
         db.settle_trade(t2, result="yes", pnl_cents=560)   # $5.60 win → net +$0.60
         assert db.all_time_live_loss_usd() == pytest.approx(0.0)
 
     def test_excludes_unsettled_live_trades(self, db):
         """Unsettled trades (open positions) must not be counted."""
-        self._live_trade(db)  # no settle_trade call
+        _save_live_trade(db)  # no settle_trade call
         assert db.all_time_live_loss_usd() == pytest.approx(0.0)
 
     def test_net_loss_wins_partially_offset_losses(self, db):
         """Wins partially offset losses → return remaining net loss."""
-        t1 = self._live_trade(db, ticker="KXBTC15M-A")
-        t2 = self._live_trade(db, ticker="KXBTC15M-B")
-        t3 = self._live_trade(db, ticker="KXBTC15M-C")
+        t1 = _save_live_trade(db, ticker="KXBTC15M-A")
+        t2 = _save_live_trade(db, ticker="KXBTC15M-B")
+        t3 = _save_live_trade(db, ticker="KXBTC15M-C")
         db.settle_trade(t1, result="no", pnl_cents=-500)   # $5 loss
         db.settle_trade(t2, result="no", pnl_cents=-480)   # $4.80 loss → $9.80 gross losses
         db.settle_trade(t3, result="yes", pnl_cents=560)   # $5.60 win → net = $9.80 - $5.60 = $4.20
@@ -711,7 +725,7 @@ class TestAllTimeLiveLossUsd:
     def test_does_not_filter_by_date(self, db):
         """Unlike daily_live_loss_usd, all_time must include old trades."""
         import time
-        t = self._live_trade(db, ticker="KXBTC15M-OLD")
+        t = _save_live_trade(db, ticker="KXBTC15M-OLD")
         # Settle first, then backdate settled_at to 30 days ago
         db.settle_trade(t, result="no", pnl_cents=-500)  # $5 loss
         db._conn.execute(
@@ -728,6 +742,24 @@ class TestAllTimeLiveLossUsd:
 # ── current_live_consecutive_losses ─────────────────────────────────
 
 
+def _bulk_live_settled(db, outcomes, base_ts=None):
+    """Insert pre-settled live YES bets in one transaction, oldest first.
+
+    outcomes: list of (result, pnl_cents) — result "yes" is a win, "no" a loss.
+    Each row gets a distinct timestamp one second after the previous one.
+    Returns the list of timestamps used.
+    """
+    base_ts = time.time() if base_ts is None else base_ts
+    timestamps = [base_ts + i for i in range(len(outcomes))]
+    insert_trade_rows(db, [
+        TradeRow(timestamp=ts, ticker=f"KXBTC15M-{i}", count=100, cost_usd=5.0,
+                 strategy="btc_drift_v1", edge_pct=0.05, win_prob=0.6, is_paper=0,
+                 result=result, pnl_cents=pnl_cents)
+        for i, (ts, (result, pnl_cents)) in enumerate(zip(timestamps, outcomes))
+    ])
+    return timestamps
+
+
 class TestCurrentLiveConsecutiveLosses:
     """
     current_live_consecutive_losses() returns (count, last_loss_ts) where
@@ -744,20 +776,11 @@ class TestCurrentLiveConsecutiveLosses:
     stale streaks and skip re-triggering.
     """
 
-    def _live(self, db, ticker, side, result, pnl_cents):
-        t = db.save_trade(
-            ticker=ticker, side=side, action="buy", price_cents=50,
-            count=100, cost_usd=5.0, is_paper=False,
-            strategy="btc_drift_v1", edge_pct=0.05, win_prob=0.6,
-        )
-        db.settle_trade(t, result=result, pnl_cents=pnl_cents)
-        return t
-
     def _paper(self, db, ticker, side, result, pnl_cents):
-        t = db.save_trade(
-            ticker=ticker, side=side, action="buy", price_cents=50,
-            count=100, cost_usd=5.0, is_paper=True,
-            strategy="btc_drift_v1", edge_pct=0.05, win_prob=0.6,
+        t = _save_trade(
+            db, ticker=ticker, side=side, price_cents=50, count=100,
+            cost_usd=5.0, is_paper=True, strategy="btc_drift_v1",
+            edge_pct=0.05, win_prob=0.6,
         )
         db.settle_trade(t, result=result, pnl_cents=pnl_cents)
         return t
@@ -776,63 +799,72 @@ class TestCurrentLiveConsecutiveLosses:
         assert ts is None
 
     def test_returns_one_for_single_live_loss(self, db):
-        self._live(db, "KXBTC15M-A", "yes", "no", -500)
+        _bulk_live_settled(db, [("no", -500)])
         streak, ts = db.current_live_consecutive_losses()
         assert streak == 1
         assert ts is not None
 
     def test_returns_zero_if_most_recent_is_win(self, db):
-        self._live(db, "KXBTC15M-A", "yes", "no", -500)  # loss
-        self._live(db, "KXBTC15M-B", "yes", "yes", +560)  # win — resets streak
+        _bulk_live_settled(db, [
+            ("no", -500),   # loss
+            ("yes", +560),  # win — resets streak
+        ])
         streak, ts = db.current_live_consecutive_losses()
         assert streak == 0
         assert ts is None
 
     def test_counts_streak_ending_in_losses(self, db):
         """Win then 3 losses → streak = 3."""
-        self._live(db, "KXBTC15M-A", "yes", "yes", +560)  # win
-        self._live(db, "KXBTC15M-B", "yes", "no", -500)   # loss 1
-        self._live(db, "KXBTC15M-C", "yes", "no", -500)   # loss 2
-        self._live(db, "KXBTC15M-D", "yes", "no", -500)   # loss 3
+        _bulk_live_settled(db, [
+            ("yes", +560),  # win
+            ("no", -500),   # loss 1
+            ("no", -500),   # loss 2
+            ("no", -500),   # loss 3
+        ])
         streak, ts = db.current_live_consecutive_losses()
         assert streak == 3
         assert ts is not None
 
     def test_stops_counting_at_first_win_from_end(self, db):
         """L L W L L → streak = 2 (only tail losses count)."""
-        self._live(db, "KXBTC15M-A", "yes", "no", -500)   # loss (old)
-        self._live(db, "KXBTC15M-B", "yes", "no", -500)   # loss (old)
-        self._live(db, "KXBTC15M-C", "yes", "yes", +560)  # win — resets
-        self._live(db, "KXBTC15M-D", "yes", "no", -500)   # loss 1
-        self._live(db, "KXBTC15M-E", "yes", "no", -500)   # loss 2
+        _bulk_live_settled(db, [
+            ("no", -500),   # loss (old)
+            ("no", -500),   # loss (old)
+            ("yes", +560),  # win — resets
+            ("no", -500),   # loss 1
+            ("no", -500),   # loss 2
+        ])
         streak, ts = db.current_live_consecutive_losses()
         assert streak == 2
         assert ts is not None
 
     def test_counts_four_consecutive_at_limit(self, db):
         """Exactly 4 consecutive losses → kill switch should fire on restore."""
-        for i in range(4):
-            self._live(db, f"KXBTC15M-{i}", "yes", "no", -500)
+        _bulk_live_settled(db, [("no", -500)] * 4)
         streak, ts = db.current_live_consecutive_losses()
         assert streak == 4
         assert ts is not None
 
+    def test_long_streak_not_truncated(self, db):
+        """The early-exit walk must still count streaks of any length."""
+        _bulk_live_settled(db, [("yes", +560)] + [("no", -500)] * 100)
+        streak, _ = db.current_live_consecutive_losses()
+        assert streak == 100
+
     def test_works_across_strategies(self, db):
         """Streak counts globally across all live strategies."""
-        db.save_trade(  # btc_lag loss
+        t1 = db.save_trade(  # btc_lag loss
             ticker="KXBTC15M-A", side="yes", action="buy", price_cents=50,
             count=100, cost_usd=5.0, is_paper=False,
             strategy="btc_lag_v1", edge_pct=0.05, win_prob=0.6,
         )
-        t1 = db._conn.execute("SELECT MAX(id) FROM trades").fetchone()[0]
         db.settle_trade(t1, result="no", pnl_cents=-500)
 
-        db.save_trade(  # eth_lag loss
+        t2 = db.save_trade(  # eth_lag loss
             ticker="KXETH15M-A", side="yes", action="buy", price_cents=50,
             count=100, cost_usd=5.0, is_paper=False,
             strategy="eth_lag_v1", edge_pct=0.05, win_prob=0.6,
         )
-        t2 = db._conn.execute("SELECT MAX(id) FROM trades").fetchone()[0]
         db.settle_trade(t2, result="no", pnl_cents=-500)
 
         streak, ts = db.current_live_consecutive_losses()
@@ -841,7 +873,7 @@ class TestCurrentLiveConsecutiveLosses:
 
     def test_ignores_unsettled_live_trades(self, db):
         """Open positions (no result yet) must not affect the streak."""
-        self._live(db, "KXBTC15M-A", "yes", "no", -500)  # settled loss
+        _bulk_live_settled(db, [("no", -500)])  # settled loss
         db.save_trade(  # open, unsettled
             ticker="KXBTC15M-B", side="yes", action="buy", price_cents=50,
             count=100, cost_usd=5.0, is_paper=False,
@@ -853,14 +885,12 @@ class TestCurrentLiveConsecutiveLosses:
 
     def test_last_loss_ts_is_most_recent_loss(self, db):
         """last_loss_ts must be the timestamp of the most recent loss, not an older one."""
-        import time as _time
-        self._live(db, "KXBTC15M-A", "yes", "no", -500)  # loss 1 (older)
-        _time.sleep(0.01)
-        self._live(db, "KXBTC15M-B", "yes", "no", -500)  # loss 2 (newer — this ts returned)
+        timestamps = _bulk_live_settled(db, [
+            ("no", -500),  # loss 1 (older)
+            ("no", -500),  # loss 2 (newer — this ts returned)
+        ])
         _, ts = db.current_live_consecutive_losses()
-        assert ts is not None
-        # ts must be close to now (within 5 seconds)
-        assert abs(_time.time() - ts) < 5.0
+        assert ts == timestamps[-1]
 
 
 class TestPostGuardCleanBets:
@@ -871,10 +901,10 @@ class TestPostGuardCleanBets:
     """
 
     def _live(self, db, pnl_cents):
-        t = db.save_trade(
-            ticker="KXBTC15M-T", side="yes", action="buy", price_cents=93,
-            count=100, cost_usd=7.44, is_paper=False,
-            strategy="expiry_sniper_v1", edge_pct=0.05, win_prob=0.956,
+        t = _save_trade(
+            db, ticker="KXBTC15M-T", price_cents=93, count=100, cost_usd=7.44,
+            is_paper=False, strategy="expiry_sniper_v1",
+            edge_pct=0.05, win_prob=0.956,
         )
         db.settle_trade(t, result="yes" if pnl_cents > 0 else "no", pnl_cents=pnl_cents)
 
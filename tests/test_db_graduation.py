@@ -19,113 +19,99 @@ from pathlib import Path
 
 import pytest
 
+from _db_helpers import TradeRow, insert_trade_rows
 from src.db import DB
 
 
 @pytest.fixture
-def fresh_db(tmp_path):
-    """Provide a freshly initialized in-memory-like DB for each test."""
-    db_path = tmp_path / "test_graduation.db"
-    db = DB(db_path)
-    db.init()
-    yield db
-    db.close()
+def fresh_db(reset_db):
+    """Provide an empty in-memory DB per test (shared connection, reset at teardown)."""
+    return reset_db
+
+
+def _trade_row(strategy: str, side: str, result: str | None,
+               win_prob: float | None = None, pnl_cents: int = 0,
+               is_paper: bool = True, ts: float | None = None) -> TradeRow:
+    """Build one graduation-test TradeRow (ts=None → now)."""
+    return TradeRow(
+        timestamp=ts, ticker=f"KXBTC-{strategy[:3].upper()}", side=side, strategy=strategy,
+        win_prob=win_prob, is_paper=int(is_paper), result=result,
+        pnl_cents=pnl_cents if result is not None else None,
+    )
 
 
 def _insert_trade(db: DB, strategy: str, side: str, result: str | None,
                   win_prob: float | None = None, pnl_cents: int = 0,
-                  is_paper: bool = True, ts: float | None = None):
+                  is_paper: bool = True, ts: float | None = None) -> None:
     """Helper to insert a trade and optionally settle it."""
-    if ts is None:
-        ts = time.time()
-    cursor = db._conn.execute(
-        """INSERT INTO trades
-           (timestamp, ticker, side, action, price_cents, count, cost_usd,
-            strategy, win_prob, is_paper, result, pnl_cents, settled_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            ts, f"KXBTC-{strategy[:3].upper()}", side, "buy",
-            50, 1, 0.50,
-            strategy, win_prob, int(is_paper),
-            result, pnl_cents if result is not None else None,
-            ts if result is not None else None,
-        ),
-    )
-    db._conn.commit()
-    return cursor.lastrowid
+    insert_trade_rows(db, [_trade_row(strategy, side, result, win_prob=win_prob,
+                                      pnl_cents=pnl_cents, is_paper=is_paper, ts=ts)])
 
 
 # ── Test: empty DB ─────────────────────────────────────────────────────────
 
 class TestGraduationStatsEmptyDB:
-    def test_returns_dict_on_empty_db(self, fresh_db):
-        result = fresh_db.graduation_stats("btc_lag_v1")
-        assert isinstance(result, dict)
-
-    def test_settled_count_zero_on_empty_db(self, fresh_db):
-        result = fresh_db.graduation_stats("btc_lag_v1")
-        assert result["settled_count"] == 0
-
-    def test_win_rate_none_on_empty_db(self, fresh_db):
+    def test_empty_db_shape(self, fresh_db):
+        """One call covers every key — all None/0 on an empty DB."""
         result = fresh_db.graduation_stats("btc_lag_v1")
-        assert result["win_rate"] is None
+        assert result == {
+            "settled_count": 0,
+            "win_rate": None,
+            "brier_score": None,
+            "consecutive_losses": 0,
+            "first_trade_ts": None,
+            "days_running": 0.0,
+            "total_pnl_usd": 0.0,
+        }
+
+    def test_empty_db_issues_single_query(self, fresh_db):
+        """No settled trades → return defaults after one SELECT, no follow-up queries."""
+        statements = []
+        fresh_db._conn.set_trace_callback(statements.append)
+        fresh_db.graduation_stats("btc_lag_v1")
+        fresh_db._conn.set_trace_callback(None)
+        assert len(statements) == 1
+
+    def test_empty_result_is_a_fresh_dict(self, fresh_db):
+        """Callers mutating the returned dict must not corrupt later empty results."""
+        first = fresh_db.graduation_stats("btc_lag_v1")
+        first["settled_count"] = 99
+        assert fresh_db.graduation_stats("btc_lag_v1")["settled_count"] == 0
 
-    def test_brier_score_none_on_empty_db(self, fresh_db):
-        result = fresh_db.graduation_stats("btc_lag_v1")
-        assert result["brier_score"] is None
 
-    def test_consecutive_losses_zero_on_empty_db(self, fresh_db):
-        result = fresh_db.graduation_stats("btc_lag_v1")
-        assert result["consecutive_losses"] == 0
-
-    def test_first_trade_ts_none_on_empty_db(self, fresh_db):
-        result = fresh_db.graduation_stats("btc_lag_v1")
-        assert result["first_trade_ts"] is None
-
-    def test_days_running_zero_on_empty_db(self, fresh_db):
-        result = fresh_db.graduation_stats("btc_lag_v1")
-        assert result["days_running"] == 0.0
-
-    def test_total_pnl_usd_zero_on_empty_db(self, fresh_db):
-        result = fresh_db.graduation_stats("btc_lag_v1")
-        assert result["total_pnl_usd"] == 0.0
+# ── Test: 50 settled paper trades ─────────────────────────────────────────
 
+@pytest.fixture(scope="class")
+def fresh_db_50(clone_db):
+    """40 paper wins + 10 paper losses, seeded once and shared read-only by the class."""
+    db = clone_db()
+    insert_trade_rows(
+        db,
+        [_trade_row("btc_lag_v1", "yes", "yes", win_prob=0.65)] * 40
+        + [_trade_row("btc_lag_v1", "yes", "no", win_prob=0.65)] * 10,
+    )
+    yield db
+    db.close()
 
-# ── Test: 50 settled paper trades ─────────────────────────────────────────
 
 class TestGraduationStatsWith50Trades:
-    def test_settled_count_is_50(self, fresh_db):
-        # Insert 40 wins and 10 losses
-        for i in range(40):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", win_prob=0.65)
-        for i in range(10):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "no", win_prob=0.65)
+    """Every test here only reads graduation_stats — safe to share fresh_db_50."""
 
-        result = fresh_db.graduation_stats("btc_lag_v1")
+    def test_settled_count_is_50(self, fresh_db_50):
+        result = fresh_db_50.graduation_stats("btc_lag_v1")
         assert result["settled_count"] == 50
 
-    def test_win_rate_is_float(self, fresh_db):
-        for i in range(30):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes")
-        for i in range(20):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "no")
-
-        result = fresh_db.graduation_stats("btc_lag_v1")
+    def test_win_rate_is_float(self, fresh_db_50):
+        result = fresh_db_50.graduation_stats("btc_lag_v1")
         assert isinstance(result["win_rate"], float)
-        assert abs(result["win_rate"] - 0.60) < 0.01
+        assert abs(result["win_rate"] - 0.80) < 0.01
 
-    def test_days_running_non_negative(self, fresh_db):
-        for i in range(50):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes")
-
-        result = fresh_db.graduation_stats("btc_lag_v1")
+    def test_days_running_non_negative(self, fresh_db_50):
+        result = fresh_db_50.graduation_stats("btc_lag_v1")
         assert result["days_running"] >= 0
 
-    def test_consecutive_losses_is_int(self, fresh_db):
-        for i in range(50):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes")
-
-        result = fresh_db.graduation_stats("btc_lag_v1")
+    def test_consecutive_losses_is_int(self, fresh_db_50):
+        result = fresh_db_50.graduation_stats("btc_lag_v1")
         assert isinstance(result["consecutive_losses"], int)
 
 
@@ -136,36 +122,36 @@ class TestConsecutiveLosses:
         """Pattern W, W, L, L, L → consecutive_losses = 3."""
         base_ts = time.time() - 1000
 
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", ts=base_ts + 0)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", ts=base_ts + 1)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "no",  ts=base_ts + 2)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "no",  ts=base_ts + 3)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "no",  ts=base_ts + 4)
+        insert_trade_rows(fresh_db, tuple(
+            _trade_row("btc_lag_v1", "yes", result, ts=base_ts + i)
+            for i, result in enumerate(("yes", "yes", "no", "no", "no"))
+        ))
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["consecutive_losses"] == 3
 
     def test_all_wins_gives_zero_consecutive_losses(self, fresh_db):
-        for i in range(5):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes")
+        insert_trade_rows(fresh_db, [_trade_row("btc_lag_v1", "yes", "yes")] * 5)
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["consecutive_losses"] == 0
 
     def test_win_at_end_resets_streak(self, fresh_db):
         """W, L, L, W → consecutive_losses = 0."""
         base_ts = time.time() - 1000
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", ts=base_ts + 0)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "no",  ts=base_ts + 1)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "no",  ts=base_ts + 2)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", ts=base_ts + 3)
+        insert_trade_rows(fresh_db, tuple(
+            _trade_row("btc_lag_v1", "yes", result, ts=base_ts + i)
+            for i, result in enumerate(("yes", "no", "no", "yes"))
+        ))
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["consecutive_losses"] == 0
 
     def test_no_side_bet_wins_when_result_is_no(self, fresh_db):
         """NO-side bet: side='no', result='no' → WIN."""
-        _insert_trade(fresh_db, "btc_lag_v1", "no", "no")  # WIN
-        _insert_trade(fresh_db, "btc_lag_v1", "no", "yes")  # LOSS
+        insert_trade_rows(fresh_db, (
+            _trade_row("btc_lag_v1", "no", "no"),   # WIN
+            _trade_row("btc_lag_v1", "no", "yes"),  # LOSS
+        ))
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["consecutive_losses"] == 1
@@ -177,12 +163,11 @@ class TestConsecutiveLosses:
 class TestPaperOnlyFilter:
     def test_live_trades_excluded(self, fresh_db):
         """is_paper=False trades must NOT count."""
-        # 10 live wins
-        for i in range(10):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", is_paper=False)
-        # 3 paper losses
-        for i in range(3):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "no", is_paper=True)
+        insert_trade_rows(
+            fresh_db,
+            [_trade_row("btc_lag_v1", "yes", "yes", is_paper=False)] * 10  # 10 live wins
+            + [_trade_row("btc_lag_v1", "yes", "no", is_paper=True)] * 3,  # 3 paper losses
+        )
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["settled_count"] == 3
@@ -190,22 +175,22 @@ class TestPaperOnlyFilter:
 
     def test_unsettled_paper_trades_excluded_from_settled_count(self, fresh_db):
         """Unsettled (result IS NULL) paper trades must not count."""
-        # Insert 5 settled wins
-        for i in range(5):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes")
-        # Insert 3 open/unsettled trades
-        for i in range(3):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", None)  # no result
+        insert_trade_rows(
+            fresh_db,
+            [_trade_row("btc_lag_v1", "yes", "yes")] * 5   # 5 settled wins
+            + [_trade_row("btc_lag_v1", "yes", None)] * 3,  # 3 open/unsettled
+        )
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["settled_count"] == 5
 
     def test_different_strategy_excluded(self, fresh_db):
         """Another strategy's trades must not appear in btc_lag_v1 stats."""
-        for i in range(20):
-            _insert_trade(fresh_db, "eth_lag_v1", "yes", "yes")
-        for i in range(2):
-            _insert_trade(fresh_db, "btc_lag_v1", "yes", "no")
+        insert_trade_rows(
+            fresh_db,
+            [_trade_row("eth_lag_v1", "yes", "yes")] * 20
+            + [_trade_row("btc_lag_v1", "yes", "no")] * 2,
+        )
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["settled_count"] == 2
@@ -235,8 +220,10 @@ class TestBrierScore:
 
     def test_brier_is_mean_over_trades_with_win_prob(self, fresh_db):
         """Two trades: (0.0, win)=1.0 brier and (1.0, win)=0.0 brier → mean = 0.5."""
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", win_prob=0.0)  # brier=1.0
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", win_prob=1.0)  # brier=0.0
+        insert_trade_rows(fresh_db, (
+            _trade_row("btc_lag_v1", "yes", "yes", win_prob=0.0),  # brier=1.0
+            _trade_row("btc_lag_v1", "yes", "yes", win_prob=1.0),  # brier=0.0
+        ))
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["brier_score"] is not None
         assert abs(result["brier_score"] - 0.5) < 1e-9
@@ -249,8 +236,10 @@ class TestFirstTradeAndDays:
         early_ts = time.time() - 86400 * 7  # 7 days ago
         late_ts = time.time() - 86400 * 2   # 2 days ago
 
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", ts=late_ts)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", ts=early_ts)
+        insert_trade_rows(fresh_db, (
+            _trade_row("btc_lag_v1", "yes", "yes", ts=late_ts),
+            _trade_row("btc_lag_v1", "yes", "yes", ts=early_ts),
+        ))
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert result["first_trade_ts"] is not None
@@ -269,8 +258,10 @@ class TestFirstTradeAndDays:
         early_unsettled_ts = time.time() - 86400 * 10
         settled_ts = time.time() - 86400 * 3
 
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", None, ts=early_unsettled_ts)  # unsettled
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", ts=settled_ts)
+        insert_trade_rows(fresh_db, (
+            _trade_row("btc_lag_v1", "yes", None, ts=early_unsettled_ts),  # unsettled
+            _trade_row("btc_lag_v1", "yes", "yes", ts=settled_ts),
+        ))
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert abs(result["first_trade_ts"] - early_unsettled_ts) < 1.0
@@ -281,8 +272,10 @@ class TestFirstTradeAndDays:
 class TestTotalPnlUsd:
     def test_total_pnl_from_pnl_cents(self, fresh_db):
         """pnl_cents=150 → total_pnl_usd = 1.50."""
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", pnl_cents=150)
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "no",  pnl_cents=-50)
+        insert_trade_rows(fresh_db, (
+            _trade_row("btc_lag_v1", "yes", "yes", pnl_cents=150),
+            _trade_row("btc_lag_v1", "yes", "no",  pnl_cents=-50),
+        ))
 
         result = fresh_db.graduation_stats("btc_lag_v1")
         assert abs(result["total_pnl_usd"] - 1.00) < 0.001
@@ -297,32 +290,36 @@ class TestTotalPnlUsd:
 class TestGraduationStatsIsLiveParam:
     def test_live_param_counts_only_live_trades(self, fresh_db):
         """is_paper=False must count live trades, ignore paper."""
-        # 5 live wins
-        for i in range(5):
-            _insert_trade(fresh_db, "btc_drift_v1", "yes", "yes", is_paper=False)
-        # 20 paper wins — must NOT be counted
-        for i in range(20):
-            _insert_trade(fresh_db, "btc_drift_v1", "yes", "yes", is_paper=True)
+        insert_trade_rows(
+            fresh_db,
+            [_trade_row("btc_drift_v1", "yes", "yes", is_paper=False)] * 5  # 5 live wins
+            # 20 paper wins — must NOT be counted
+            + [_trade_row("btc_drift_v1", "yes", "yes", is_paper=True)] * 20,
+        )
 
         result = fresh_db.graduation_stats("btc_drift_v1", is_paper=False)
         assert result["settled_count"] == 5
 
     def test_live_param_returns_correct_win_rate(self, fresh_db):
         """Win rate from live trades only."""
-        # 3 live wins, 1 live loss
-        for i in range(3):
-            _insert_trade(fresh_db, "btc_drift_v1", "yes", "yes", is_paper=False)
-        _insert_trade(fresh_db, "btc_drift_v1", "yes", "no", is_paper=False)
-        # Paper loss — must not affect live win rate
-        _insert_trade(fresh_db, "btc_drift_v1", "yes", "no", is_paper=True)
+        insert_trade_rows(
+            fresh_db,
+            # 3 live wins, 1 live loss
+            [_trade_row("btc_drift_v1", "yes", "yes", is_paper=False)] * 3
+            + [_trade_row("btc_drift_v1", "yes", "no", is_paper=False)]
+            # Paper loss — must not affect live win rate
+            + [_trade_row("btc_drift_v1", "yes", "no", is_paper=True)],
+        )
 
         result = fresh_db.graduation_stats("btc_drift_v1", is_paper=False)
         assert abs(result["win_rate"] - 0.75) < 0.01
 
     def test_default_is_paper_true_unchanged(self, fresh_db):
         """Calling with no is_paper arg still returns paper-only stats."""
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "yes", is_paper=False)  # live win
-        _insert_trade(fresh_db, "btc_lag_v1", "yes", "no",  is_paper=True)   # paper loss
+        insert_trade_rows(fresh_db, (
+            _trade_row("btc_lag_v1", "yes", "yes", is_paper=False),  # live win
+            _trade_row("btc_lag_v1", "yes", "no",  is_paper=True),   # paper loss
+        ))
 
         result = fresh_db.graduation_stats("btc_lag_v1")  # default is_paper=True
         assert result["settled_count"] == 1
@@ -339,10 +336,29 @@ class TestGraduationStatsIsLiveParam:
         early_paper_ts = time.time() - 86400 * 30  # 30 days ago
         live_ts = time.time() - 86400 * 5           # 5 days ago
 
-        _insert_trade(fresh_db, "btc_drift_v1", "yes", "yes",
-                      is_paper=True, ts=early_paper_ts)
-        _insert_trade(fresh_db, "btc_drift_v1", "yes", "yes",
-                      is_paper=False, ts=live_ts)
+        insert_trade_rows(fresh_db, (
+            _trade_row("btc_drift_v1", "yes", "yes", is_paper=True, ts=early_paper_ts),
+            _trade_row("btc_drift_v1", "yes", "yes", is_paper=False, ts=live_ts),
+        ))
 
         result = fresh_db.graduation_stats("btc_drift_v1", is_paper=False)
         assert abs(result["first_trade_ts"] - live_ts) < 1.0
+
+
+# ── Test: query plan ──────────────────────────────────────────────────────
+
+class TestGraduationStatsIndex:
+    def test_streak_query_uses_strategy_paper_ts_index(self, fresh_db):
+        """graduation_stats' newest-first streak walk must use the composite index, not sort."""
+        # One settled trade so graduation_stats() gets past the aggregate and
+        # runs the streak query; trace it and EXPLAIN the exact statement sent.
+        insert_trade_rows(fresh_db, [_trade_row("btc_lag_v1", "yes", "yes")])
+        statements = []
+        fresh_db._conn.set_trace_callback(statements.append)
+        fresh_db.graduation_stats("btc_lag_v1")
+        fresh_db._conn.set_trace_callback(None)
+        (streak_sql,) = [sql for sql in statements if "ORDER BY" in sql]
+        plan = fresh_db._conn.execute(f"EXPLAIN QUERY PLAN {streak_sql}").fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_trades_strategy_paper_ts" in details
+        assert "TEMP B-TREE" not in details
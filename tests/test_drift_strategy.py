@@ -2,7 +2,7 @@
 Tests for src/strategies/btc_drift.py — BTC drift-from-open signal generation.
 
 Uses real BTCDriftStrategy (no mocking of the strategy logic).
-Mocks Market, OrderBook, and BinanceFeed to control test inputs.
+Builds Market and OrderBook and stubs BinanceFeed (tests/_drift_helpers.py) to control test inputs.
 
 Key difference from btc_lag tests: btc_drift uses btc_feed.current_price()
 (not btc_move_pct) and tracks reference prices per market ticker.
@@ -12,270 +12,263 @@ On subsequent calls, it measures drift from that reference.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+import copy
+from functools import lru_cache
+from typing import Optional
 
 import pytest
 
-from src.strategies.btc_drift import BTCDriftStrategy
-from src.platforms.kalshi import Market, OrderBook, OrderBookLevel
+from _drift_helpers import EMPTY_OB, StubFeed, frozen_drift_clock, make_btc_feed, make_market
+from src.strategies.btc_drift import (
+    BTCDriftStrategy, _MAX_SIGNAL_PRICE_CENTS, _MIN_SIGNAL_PRICE_CENTS,
+)
+from src.platforms.kalshi import Market
+
+# Whole file on one pytest-xdist worker (--dist loadgroup): module-scoped
+# fixtures such as the frozen btc_drift clock are then built once, not per worker.
+pytestmark = pytest.mark.xdist_group("drift_strategy")
 
 
 # ── Helpers ───────────────────────────────────────────────────────
 
 
-def _make_market(
-    ticker: str = "KXBTC15M-TEST",
-    yes_price: int = 50,
-    no_price: int = 50,
-    minutes_remaining: float = 10.0,
-    minutes_since_open: float = 5.0,
-    status: str = "open",
-) -> Market:
-    now = datetime.now(timezone.utc)
-    close_time = (now + timedelta(minutes=minutes_remaining)).isoformat()
-    open_time = (now - timedelta(minutes=minutes_since_open)).isoformat()
-    return Market(
-        ticker=ticker,
-        title="Test market",
-        event_ticker="KXBTC15M",
-        status=status,
-        yes_price=yes_price,
-        no_price=no_price,
-        volume=1000,
-        close_time=close_time,
-        open_time=open_time,
-        result=None,
-        raw={},
-    )
+@pytest.fixture(scope="module", autouse=True)
+def _frozen_clock():
+    """Freeze btc_drift's datetime.now() at NOW for this module (other modules see real time)."""
+    with frozen_drift_clock():
+        yield
 
 
-def _make_orderbook(yes_bids=None, no_bids=None) -> OrderBook:
-    return OrderBook(
-        yes_bids=[OrderBookLevel(price=b[0], quantity=b[1]) for b in (yes_bids or [])],
-        no_bids=[OrderBookLevel(price=b[0], quantity=b[1]) for b in (no_bids or [])],
+@lru_cache(maxsize=None)
+def _template(
+    sensitivity: float = 300.0,
+    min_edge_pct: float = 0.05,
+    min_minutes_remaining: float = 3.0,
+    time_weight: float = 0.7,
+    min_drift_pct: float = 0.05,
+) -> BTCDriftStrategy:
+    """One BTCDriftStrategy per config, built once — never use it directly, copy it."""
+    return BTCDriftStrategy(
+        sensitivity=sensitivity,
+        min_edge_pct=min_edge_pct,
+        min_minutes_remaining=min_minutes_remaining,
+        time_weight=time_weight,
+        min_drift_pct=min_drift_pct,
     )
 
 
-def _make_btc_feed(current_price=50000.0, is_stale: bool = False):
-    feed = MagicMock()
-    feed.is_stale = is_stale
-    feed.current_price.return_value = current_price
-    return feed
+def _fresh_copy(template: BTCDriftStrategy) -> BTCDriftStrategy:
+    """Shallow copy of a template strategy with its own empty reference map."""
+    s = copy.copy(template)
+    s._reference_prices = {}
+    return s
 
 
-def _default_strategy() -> BTCDriftStrategy:
-    return BTCDriftStrategy(
-        sensitivity=300.0,
-        min_edge_pct=0.05,
-        min_minutes_remaining=3.0,
-        time_weight=0.7,
-        min_drift_pct=0.05,
-    )
+def _drift_strategy(**config) -> BTCDriftStrategy:
+    """Fresh strategy for `config` (see _template for the defaults), without re-running __init__."""
+    return _fresh_copy(_template(**config))
+
+
+# One strategy per test class; the per-test fixtures below only clear its
+# reference map — the one piece of state generate_signal mutates.
+@pytest.fixture(scope="class")
+def _class_strategy() -> BTCDriftStrategy:
+    return _drift_strategy()
+
+
+@pytest.fixture(scope="class")
+def _class_low_edge_strategy() -> BTCDriftStrategy:
+    # Edge floor low enough that any real drift fires a signal.
+    return _drift_strategy(min_edge_pct=0.01, min_drift_pct=0.0)
+
+
+@pytest.fixture
+def default_strategy(_class_strategy) -> BTCDriftStrategy:
+    _class_strategy._reference_prices.clear()
+    return _class_strategy
+
+
+@pytest.fixture
+def low_edge_strategy(_class_low_edge_strategy) -> BTCDriftStrategy:
+    _class_low_edge_strategy._reference_prices.clear()
+    return _class_low_edge_strategy
 
 
 def _strategy_seed_reference(strategy: BTCDriftStrategy, market: Market, ref_price: float):
     """
-    Seed the strategy's reference price for a market ticker by calling
-    generate_signal once (which returns None and sets the reference).
+    Seed the strategy's reference price for a market ticker directly — the same
+    (price, minutes_late) entry a first generate_signal call would record,
+    without running that call. TestReferencePrice covers the real first-call path.
     """
-    feed = _make_btc_feed(current_price=ref_price)
-    result = strategy.generate_signal(market, _make_orderbook(), feed)
+    strategy._reference_prices[market.ticker] = (
+        ref_price, BTCDriftStrategy._minutes_since_open(market),
+    )
+
+
+def _observe_first(strategy: BTCDriftStrategy, market: Market, ref_price: float):
+    """Record the reference through generate_signal, which must hold (return None)."""
+    result = strategy.generate_signal(market, EMPTY_OB, make_btc_feed(current_price=ref_price))
     assert result is None, "First call should always return None (sets reference)"
 
 
+def _run_signal(
+    *,
+    min_edge_pct: float = 0.01,
+    min_minutes_remaining: float = 3.0,
+    min_drift_pct: float = 0.05,
+    ref: float = 50000.0,
+    current: float = 51000.0,
+    mins_rem: float = 5.0,
+    mins_open: float = 10.0,
+    yes_price: int = 50,
+    no_price: int = 50,
+    minutes_late: Optional[float] = None,
+):
+    """
+    Strategy → market → reference → feed → generate_signal, in one call.
+
+    The reference is seeded as a first observation would record it, unless
+    minutes_late is given — then it is injected with that staleness instead.
+    """
+    s = _drift_strategy(
+        min_edge_pct=min_edge_pct,
+        min_minutes_remaining=min_minutes_remaining,
+        min_drift_pct=min_drift_pct,
+    )
+    market = make_market(
+        yes_price=yes_price, no_price=no_price,
+        minutes_remaining=mins_rem, minutes_since_open=mins_open,
+    )
+    if minutes_late is None:
+        _strategy_seed_reference(s, market, ref_price=ref)
+    else:
+        s._reference_prices[market.ticker] = (ref, minutes_late)
+    return s.generate_signal(market, EMPTY_OB, make_btc_feed(current_price=current))
+
+
 # ── Gate 1: BTC feed health ───────────────────────────────────────
 
 
 class TestFeedGate:
-    def test_stale_feed_returns_none(self):
-        s = _default_strategy()
-        signal = s.generate_signal(
-            _make_market(), _make_orderbook(), _make_btc_feed(is_stale=True)
-        )
-        assert signal is None
-
-    def test_none_current_price_returns_none(self):
-        s = _default_strategy()
-        signal = s.generate_signal(
-            _make_market(), _make_orderbook(), _make_btc_feed(current_price=None)
-        )
-        assert signal is None
+    @pytest.mark.parametrize("feed", [
+        StubFeed(50000.0, stale=True),
+        StubFeed(None),
+    ], ids=["stale_feed", "none_current_price"])
+    def test_bad_feed_returns_none(self, default_strategy, feed):
+        assert default_strategy.generate_signal(make_market(), EMPTY_OB, feed) is None
 
 
 # ── Reference price tracking ─────────────────────────────────────
 
 
 class TestReferencePrice:
-    def test_first_observation_sets_reference_and_returns_none(self):
+    def test_first_observation_sets_reference_and_returns_none(self, default_strategy):
         """On first observation, strategy records BTC price and holds (no signal yet)."""
-        s = _default_strategy()
-        market = _make_market()
-        feed = _make_btc_feed(current_price=50000.0)
-        signal = s.generate_signal(market, _make_orderbook(), feed)
+        s = default_strategy
+        market = make_market()
+        feed = make_btc_feed(current_price=50000.0)
+        signal = s.generate_signal(market, EMPTY_OB, feed)
         assert signal is None
         assert "KXBTC15M-TEST" in s._reference_prices
         assert s._reference_prices["KXBTC15M-TEST"][0] == 50000.0
 
-    def test_second_observation_uses_stored_reference(self):
+    def test_second_observation_uses_stored_reference(self, low_edge_strategy):
         """After reference is set, strategy computes drift and can generate a signal."""
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.01,  # low edge floor to ensure signal fires
-            min_minutes_remaining=3.0, time_weight=0.7, min_drift_pct=0.0,
-        )
-        market = _make_market(yes_price=50, no_price=50)
+        s = low_edge_strategy
+        market = make_market(yes_price=50, no_price=50)
         # Set reference at 50000
-        _strategy_seed_reference(s, market, ref_price=50000.0)
+        _observe_first(s, market, ref_price=50000.0)
         # BTC drifted up 2% → strong YES signal
-        feed = _make_btc_feed(current_price=51000.0)
-        signal = s.generate_signal(market, _make_orderbook(), feed)
+        feed = make_btc_feed(current_price=51000.0)
+        signal = s.generate_signal(market, EMPTY_OB, feed)
         assert signal is not None
         assert signal.side == "yes"
 
-    def test_different_tickers_have_separate_references(self):
+    @pytest.mark.parametrize("pairs", [
+        [("KXBTC15M-A", 50000.0), ("KXBTC15M-B", 51000.0)],
+        [("KXBTC15M-A", 50000.0), ("KXBTC15M-B", 51000.0), ("KXBTC15M-C", 49500.0)],
+    ], ids=["two_tickers", "three_tickers"])
+    def test_different_tickers_have_separate_references(self, default_strategy, pairs):
         """Each market ticker gets its own BTC reference price."""
-        s = _default_strategy()
-        market_a = _make_market(ticker="KXBTC15M-A")
-        market_b = _make_market(ticker="KXBTC15M-B")
-        # Seed different references
-        _strategy_seed_reference(s, market_a, ref_price=50000.0)
-        _strategy_seed_reference(s, market_b, ref_price=51000.0)
-        assert s._reference_prices["KXBTC15M-A"][0] == 50000.0
-        assert s._reference_prices["KXBTC15M-B"][0] == 51000.0
-
-
-# ── Gate 2: Drift threshold ──────────────────────────────────────
-
-
-class TestDriftGate:
-    def test_zero_drift_returns_none(self):
-        """If BTC hasn't moved from reference, no signal."""
-        s = _default_strategy()
-        market = _make_market()
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=50000.0)  # zero drift
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        assert signal is None
-
-    def test_drift_below_minimum_returns_none(self):
-        """Drift below min_drift_pct (0.05%) returns None."""
-        s = _default_strategy()  # min_drift_pct=0.05
-        market = _make_market()
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        # 0.03% drift — below 0.05% threshold
-        feed = _make_btc_feed(current_price=50015.0)
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        assert signal is None
-
-    def test_drift_above_minimum_passes_gate(self):
-        """Drift above min_drift_pct proceeds to signal evaluation."""
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.01, min_minutes_remaining=3.0,
-            time_weight=0.7, min_drift_pct=0.05,
+        for ticker, price in pairs:
+            _observe_first(default_strategy, make_market(ticker=ticker), ref_price=price)
+        for ticker, price in pairs:
+            assert default_strategy._reference_prices[ticker][0] == price
+
+
+# ── Gates 2–3 + edge floor: drift, time remaining, min edge ─────
+
+
+# Every case seeds a 50000 reference on a 50¢/50¢ market.
+# (current, min_drift, min_edge, min_mins, mins_rem, expect_signal)
+_GATE_CASES = [
+    # Gate 2: drift threshold
+    pytest.param(50000.0, 0.05, 0.05, 3.0, 10.0, False, id="drift_zero"),
+    pytest.param(50015.0, 0.05, 0.05, 3.0, 10.0, False, id="drift_below_min"),   # 0.03% < 0.05%
+    pytest.param(50500.0, 0.05, 0.05, 3.0, 10.0, True, id="drift_above_min"),    # 1%
+    # Gate 3: time remaining
+    pytest.param(51000.0, 0.05, 0.05, 3.0, 2.9, False, id="time_below_floor"),
+    pytest.param(51000.0, 0.05, 0.05, 3.0, 3.0, False, id="time_at_floor"),      # floor itself blocks
+    pytest.param(51000.0, 0.05, 0.05, 3.0, 3.1, True, id="time_above_floor"),
+    # Edge floor
+    pytest.param(51000.0, 0.0, 0.99, 3.0, 10.0, False, id="edge_floor_unreachable"),
+    pytest.param(51000.0, 0.0, 0.01, 3.0, 10.0, True, id="edge_floor_low"),
+]
+
+
+class TestGates:
+    @pytest.mark.parametrize(
+        "current,min_drift,min_edge,min_mins,mins_rem,expect_signal", _GATE_CASES,
+    )
+    def test_gate(self, current, min_drift, min_edge, min_mins, mins_rem, expect_signal):
+        signal = _run_signal(
+            min_edge_pct=min_edge, min_minutes_remaining=min_mins, min_drift_pct=min_drift,
+            current=current, mins_rem=mins_rem, mins_open=5.0,
         )
-        market = _make_market(yes_price=50, no_price=50)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        # 1% drift — well above threshold
-        feed = _make_btc_feed(current_price=50500.0)
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        # Should produce a signal (edge gate is low)
-        assert signal is not None
-
-
-# ── Gate 3: Time remaining ────────────────────────────────────────
+        assert (signal is not None) == expect_signal
 
 
-class TestTimeGate:
-    def test_less_than_min_minutes_remaining_returns_none(self):
-        s = _default_strategy()  # min_minutes_remaining=3.0
-        market = _make_market(minutes_remaining=2.9)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=51000.0)  # large drift
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        assert signal is None
-
-    def test_exactly_at_min_minutes_returns_none(self):
-        s = _default_strategy()
-        market = _make_market(minutes_remaining=3.0)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=51000.0)
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        assert signal is None
-
-    def test_above_min_minutes_passes_time_gate(self):
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.01, min_minutes_remaining=3.0,
-            time_weight=0.7, min_drift_pct=0.05,
-        )
-        market = _make_market(yes_price=50, no_price=50, minutes_remaining=3.1)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=51000.0)  # 2% up
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        assert signal is not None
+# ── Signal correctness ────────────────────────────────────────────
 
 
-# ── Signal correctness ────────────────────────────────────────────
+# (current_price, expected_side) against a 50000 reference.
+_DIRECTION_CASES = [
+    (51000.0, "yes"),   # +2% drift
+    (49000.0, "no"),    # -2% drift
+]
 
 
 class TestSignalGeneration:
-    @pytest.fixture
-    def yes_signal(self):
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.01, min_minutes_remaining=3.0,
-            time_weight=0.7, min_drift_pct=0.0,
-        )
-        market = _make_market(yes_price=50, no_price=50, minutes_remaining=10.0, minutes_since_open=5.0)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=51000.0)  # +2% → YES
-        return s.generate_signal(market, _make_orderbook(), feed)
-
-    @pytest.fixture
-    def no_signal(self):
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.01, min_minutes_remaining=3.0,
-            time_weight=0.7, min_drift_pct=0.0,
+    @pytest.mark.parametrize("current_price,expected_side", _DIRECTION_CASES,
+                             ids=["btc_up", "btc_down"])
+    def test_drift_direction_picks_side(self, low_edge_strategy, current_price, expected_side):
+        """±2% drift: matching side, win_prob above a coin flip, positive edge, sane confidence."""
+        market = make_market(yes_price=50, no_price=50, minutes_remaining=10.0, minutes_since_open=5.0)
+        _strategy_seed_reference(low_edge_strategy, market, ref_price=50000.0)
+        signal = low_edge_strategy.generate_signal(market, EMPTY_OB, make_btc_feed(current_price))
+        assert signal is not None
+        side, win_prob, edge_pct, confidence, ticker = (
+            signal.side, signal.win_prob, signal.edge_pct, signal.confidence, signal.ticker,
         )
-        market = _make_market(yes_price=50, no_price=50, minutes_remaining=10.0, minutes_since_open=5.0)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=49000.0)  # -2% → NO
-        return s.generate_signal(market, _make_orderbook(), feed)
-
-    def test_btc_up_generates_yes_signal(self, yes_signal):
-        assert yes_signal is not None
-        assert yes_signal.side == "yes"
-
-    def test_btc_down_generates_no_signal(self, no_signal):
-        assert no_signal is not None
-        assert no_signal.side == "no"
+        assert side == expected_side
+        assert win_prob > 0.5
+        assert edge_pct > 0
+        assert 0.0 <= confidence <= 1.0
+        assert ticker == "KXBTC15M-TEST"
+
+    def test_generate_signal_does_not_mutate_market(self, low_edge_strategy):
+        """make_market hands out shared cached instances — the strategy must not edit them."""
+        market = make_market(yes_price=50, no_price=50)
+        assert make_market() is market  # same shape, spelled differently → same instance
+        before = copy.deepcopy(market)
+        _strategy_seed_reference(low_edge_strategy, market, ref_price=50000.0)
+        assert low_edge_strategy.generate_signal(market, EMPTY_OB, make_btc_feed(51000.0)) is not None
+        assert market == before
 
     def test_strategy_name(self):
         s = BTCDriftStrategy()
         assert s.name == "btc_drift_v1"
 
-    def test_thin_edge_returns_none(self):
-        """With very high min_edge_pct, even strong drift doesn't fire."""
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.99,  # impossible to meet
-            min_minutes_remaining=3.0, time_weight=0.7, min_drift_pct=0.0,
-        )
-        market = _make_market(yes_price=50, no_price=50)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=51000.0)
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        assert signal is None
-
-    def test_win_prob_above_coin_flip(self, yes_signal):
-        assert yes_signal.win_prob > 0.5
-
-    def test_edge_pct_positive(self, yes_signal):
-        assert yes_signal.edge_pct > 0
-
-    def test_confidence_in_valid_range(self, yes_signal):
-        assert 0.0 <= yes_signal.confidence <= 1.0
-
-    def test_ticker_matches_market(self, yes_signal):
-        assert yes_signal.ticker == "KXBTC15M-TEST"
-
 
 # ── Time adjustment effect ────────────────────────────────────────
 
@@ -283,33 +276,45 @@ class TestSignalGeneration:
 class TestTimeAdjustment:
     """Verify that confidence increases as market approaches close."""
 
-    def _get_confidence(self, minutes_remaining: float, minutes_since_open: float) -> float:
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.01, min_minutes_remaining=0.0,
-            time_weight=0.7, min_drift_pct=0.0,
-        )
-        market = _make_market(
-            yes_price=50, no_price=50,
-            minutes_remaining=minutes_remaining,
-            minutes_since_open=minutes_since_open,
-        )
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        feed = _make_btc_feed(current_price=51000.0)  # +2% drift
-        signal = s.generate_signal(market, _make_orderbook(), feed)
-        return signal.confidence if signal else 0.0
+    # (minutes_remaining, minutes_since_open) in a 20-min window, early → late.
+    _ELAPSED_STEPS = [(19.0, 1.0), (10.0, 10.0), (1.0, 19.0)]
 
-    def test_late_market_has_higher_confidence_than_early(self):
-        """At 95% through the market window, confidence is higher than at 5%."""
-        # 1 min left out of 20 total = 95% elapsed
-        late_confidence = self._get_confidence(minutes_remaining=1.0, minutes_since_open=19.0)
-        # 1 min elapsed out of 20 total = 5% elapsed
-        early_confidence = self._get_confidence(minutes_remaining=19.0, minutes_since_open=1.0)
-        assert late_confidence > early_confidence
+    def test_confidence_monotone_in_elapsed(self):
+        """Confidence never drops as the window elapses; 95% elapsed beats 5%."""
+        confidences = []
+        for mr, mso in self._ELAPSED_STEPS:
+            signal = _run_signal(
+                min_minutes_remaining=0.0, min_drift_pct=0.0,  # +2% drift (default current)
+                mins_rem=mr, mins_open=mso,
+            )
+            confidences.append(signal.confidence if signal else 0.0)
+        assert confidences == sorted(confidences)
+        assert confidences[-1] > confidences[0]
 
 
 # ── Late-entry penalty (reference staleness) ─────────────────────
 
 
+@pytest.fixture(scope="module")
+def late_signal_map(_frozen_clock) -> dict:
+    """
+    minutes_late → Signal, each computed once for the whole module.
+
+    Every signal has BTC +2% from a reference set `minutes_late` minutes after
+    the market opened, on a fixed 5-min-left / 10-min-since-open market. The
+    reference is injected directly so time_factor is identical across all
+    minutes_late values — this isolates the late_penalty from the
+    time-remaining confidence adjustment.
+
+    Module scope (not session) and the explicit _frozen_clock dependency keep
+    these signals on the same frozen clock as the rest of the module.
+    """
+    return {
+        minutes_late: _run_signal(min_minutes_remaining=1.0, minutes_late=minutes_late)
+        for minutes_late in (0.0, 1.5, 8.0, 10.0, 14.0)
+    }
+
+
 class TestLateEntryPenalty:
     """
     When the bot first observes a market mid-window (e.g. after a restart),
@@ -317,78 +322,51 @@ class TestLateEntryPenalty:
     confidence should be penalised proportionally.
     """
 
-    def _signal_with_late_entry(self, minutes_late: float) -> object:
-        """
-        Return a signal where the reference was set `minutes_late` minutes
-        after the market opened.  BTC moves +2% from the reference.
-
-        Inject _reference_prices directly so that time_factor is identical
-        across all minutes_late values — this isolates the late_penalty from
-        the time-remaining confidence adjustment.
-        """
-        s = BTCDriftStrategy(
-            sensitivity=300.0,
-            min_edge_pct=0.01,      # very low threshold so signal fires
-            min_minutes_remaining=1.0,
-            time_weight=0.7,
-            min_drift_pct=0.05,
-        )
-        # Fixed market geometry: 5 min left, 10 min since open.
-        # time_factor is the same regardless of minutes_late.
-        market = _make_market(
-            yes_price=50, no_price=50,
-            minutes_remaining=5.0,
-            minutes_since_open=10.0,
-        )
-        # Inject reference directly — (price, minutes_late stored at first-obs)
-        s._reference_prices[market.ticker] = (50000.0, minutes_late)
-        feed = _make_btc_feed(current_price=51000.0)  # +2% drift
-        return s.generate_signal(market, _make_orderbook(), feed)
-
-    def test_on_time_reference_no_penalty(self):
+    def test_on_time_reference_no_penalty(self, late_signal_map):
         """First observation within 2 min of open: no penalty applied."""
-        sig_on_time = self._signal_with_late_entry(0.0)
-        sig_slightly_late = self._signal_with_late_entry(1.5)
+        sig_on_time = late_signal_map[0.0]
+        sig_slightly_late = late_signal_map[1.5]
         assert sig_on_time is not None
         assert sig_slightly_late is not None
         # Confidence should be similar (within penalty threshold of 2 min)
         assert abs(sig_on_time.confidence - sig_slightly_late.confidence) < 0.02
 
-    def test_late_reference_reduces_confidence(self):
+    def test_late_reference_reduces_confidence(self, late_signal_map):
         """Reference set 10 min late should have lower confidence than on-time."""
-        sig_on_time = self._signal_with_late_entry(0.0)
-        sig_late = self._signal_with_late_entry(10.0)
+        sig_on_time = late_signal_map[0.0]
+        sig_late = late_signal_map[10.0]
         assert sig_on_time is not None
         assert sig_late is not None
         assert sig_late.confidence < sig_on_time.confidence
 
-    def test_very_late_reference_halves_confidence(self):
+    def test_very_late_reference_halves_confidence(self, late_signal_map):
         """Reference set near end of window (14 min late) should cap at ~50% confidence."""
-        sig = self._signal_with_late_entry(14.0)
+        sig = late_signal_map[14.0]
         assert sig is not None
         # late_penalty at 14min late = max(0.5, 1.0 - (14-2)/16) = max(0.5, 0.25) = 0.5
-        sig_on_time = self._signal_with_late_entry(0.0)
+        sig_on_time = late_signal_map[0.0]
         assert sig_on_time is not None
         # Late signal confidence should be at most 50% of on-time signal confidence
         assert sig.confidence <= sig_on_time.confidence * 0.55
 
-    def test_reason_includes_late_marker(self):
+    def test_reason_includes_late_marker(self, late_signal_map):
         """Reason string should mention late reference when minutes_late > 2."""
-        sig = self._signal_with_late_entry(8.0)
+        sig = late_signal_map[8.0]
         assert sig is not None
         assert "late" in sig.reason.lower()
 
-    def test_reason_clean_when_on_time(self):
+    def test_reason_clean_when_on_time(self, late_signal_map):
         """On-time reference should not add noise to reason string."""
-        sig = self._signal_with_late_entry(0.0)
+        sig = late_signal_map[0.0]
         assert sig is not None
         assert "late" not in sig.reason.lower()
 
     def test_minutes_since_open_helper_zero_at_open(self):
-        """Market just opened (open_time == now): minutes_since_open ≈ 0."""
-        market = _make_market(minutes_since_open=0.0, minutes_remaining=15.0)
+        """Market just opened (open_time == now): minutes_since_open == 0."""
+        market = make_market(minutes_since_open=0.0, minutes_remaining=15.0)
         result = BTCDriftStrategy._minutes_since_open(market)
-        assert result < 0.5  # within half a minute of zero
+        # Exact: the market and the strategy read the same frozen NOW.
+        assert result == pytest.approx(0.0, abs=1e-9)
 
 
 # ── Price extremes filter ─────────────────────────────────────────
@@ -402,16 +380,11 @@ class TestPriceExtremesFilter:
     """
 
     def _signal_at_price(self, yes_price: int, no_price: int) -> object:
-        s = BTCDriftStrategy(
-            sensitivity=300.0, min_edge_pct=0.01,
-            min_minutes_remaining=3.0, min_drift_pct=0.05,
+        # +1% drift fires a strong YES signal anywhere inside the calibrated range.
+        return _run_signal(
+            yes_price=yes_price, no_price=no_price,
+            current=50500.0, mins_rem=8.0, mins_open=5.0,
         )
-        market = _make_market(yes_price=yes_price, no_price=no_price,
-                              minutes_remaining=8.0, minutes_since_open=5.0)
-        _strategy_seed_reference(s, market, ref_price=50000.0)
-        # BTC drifts enough to fire a signal in normal range
-        feed = _make_btc_feed(current_price=50500.0)  # +1% drift → strong YES signal
-        return s.generate_signal(market, _make_orderbook(), feed)
 
     def test_signal_blocked_below_10_cents(self):
         """Price at 3¢ YES is below the 10¢ floor — must be skipped."""
@@ -435,12 +408,11 @@ class TestPriceExtremesFilter:
 
     def test_price_range_constants_are_35_65(self):
         """Range tightened from 10–90 to 35–65 on 2026-03-01 — verify constants."""
-        from src.strategies.btc_drift import _MIN_SIGNAL_PRICE_CENTS, _MAX_SIGNAL_PRICE_CENTS
         assert _MIN_SIGNAL_PRICE_CENTS == 35
         assert _MAX_SIGNAL_PRICE_CENTS == 65
 
     def test_minutes_since_open_helper_reflects_elapsed(self):
-        """Market opened 7 min ago: _minutes_since_open returns ≈ 7."""
-        market = _make_market(minutes_since_open=7.0, minutes_remaining=8.0)
+        """Market opened 7 min ago: _minutes_since_open returns 7."""
+        market = make_market(minutes_since_open=7.0, minutes_remaining=8.0)
         result = BTCDriftStrategy._minutes_since_open(market)
-        assert 6.5 < result < 7.5
+        assert result == pytest.approx(7.0, abs=1e-9)
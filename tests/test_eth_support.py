@@ -12,14 +12,18 @@ Verifies:
 from __future__ import annotations
 
 import logging
-from unittest.mock import MagicMock, patch
 
 import pytest
 
+from _drift_helpers import EMPTY_OB, frozen_drift_clock, make_btc_feed, make_market
 from src.data.binance import BinanceFeed, load_eth_from_config, _BINANCE_ETH_WS_URL
 from src.strategies.btc_lag import BTCLagStrategy, load_eth_lag_from_config
 from src.strategies.btc_drift import BTCDriftStrategy, load_eth_drift_from_config
 
+# Whole file on one pytest-xdist worker (--dist loadgroup), like loadfile;
+# runs in parallel with test_drift_strategy.py's group.
+pytestmark = pytest.mark.xdist_group("eth_support")
+
 
 # ── Feed factory ──────────────────────────────────────────────────────
 
@@ -39,46 +43,27 @@ class TestEthFeed:
         assert "btcusdt" not in _BINANCE_ETH_WS_URL
 
 
-# ── BTCLagStrategy name override ──────────────────────────────────────
-
-
-class TestLagNameOverride:
-    def test_default_name_is_btc_lag_v1(self):
-        s = BTCLagStrategy()
-        assert s.name == "btc_lag_v1"
-
-    def test_name_override_sets_name(self):
-        s = BTCLagStrategy(name_override="eth_lag_v1")
-        assert s.name == "eth_lag_v1"
-
-    def test_eth_lag_factory_name(self):
-        s = load_eth_lag_from_config()
-        assert s.name == "eth_lag_v1"
-
-    def test_eth_lag_factory_returns_strategy_instance(self):
-        s = load_eth_lag_from_config()
-        assert isinstance(s, BTCLagStrategy)
-
+# ── Strategy name override + ETH factories ──────────────────────────
 
-# ── BTCDriftStrategy name override ───────────────────────────────────
 
+class TestStrategyNames:
+    @pytest.mark.parametrize("cls,override,expected_name", [
+        (BTCLagStrategy, None, "btc_lag_v1"),
+        (BTCLagStrategy, "eth_lag_v1", "eth_lag_v1"),
+        (BTCDriftStrategy, None, "btc_drift_v1"),
+        (BTCDriftStrategy, "eth_drift_v1", "eth_drift_v1"),
+    ], ids=["lag_default", "lag_override", "drift_default", "drift_override"])
+    def test_name_override(self, cls, override, expected_name):
+        assert cls(name_override=override).name == expected_name
 
-class TestDriftNameOverride:
-    def test_default_name_is_btc_drift_v1(self):
-        s = BTCDriftStrategy()
-        assert s.name == "btc_drift_v1"
-
-    def test_name_override_sets_name(self):
-        s = BTCDriftStrategy(name_override="eth_drift_v1")
-        assert s.name == "eth_drift_v1"
-
-    def test_eth_drift_factory_name(self):
-        s = load_eth_drift_from_config()
-        assert s.name == "eth_drift_v1"
-
-    def test_eth_drift_factory_returns_strategy_instance(self):
-        s = load_eth_drift_from_config()
-        assert isinstance(s, BTCDriftStrategy)
+    @pytest.mark.parametrize("factory,expected_cls,expected_name", [
+        (load_eth_lag_from_config, BTCLagStrategy, "eth_lag_v1"),
+        (load_eth_drift_from_config, BTCDriftStrategy, "eth_drift_v1"),
+    ], ids=["eth_lag", "eth_drift"])
+    def test_eth_factory(self, factory, expected_cls, expected_name):
+        s = factory()
+        assert isinstance(s, expected_cls)
+        assert s.name == expected_name
 
 
 # ── Near-miss INFO log for btc_drift ─────────────────────────────────
@@ -87,48 +72,32 @@ class TestDriftNameOverride:
 class TestDriftNearMissLog:
     """When BTC drift is below min_drift_pct, btc_drift logs at INFO (not just DEBUG)."""
 
+    @pytest.fixture(autouse=True)
+    def _frozen_clock(self):
+        """Build markets and run btc_drift against one frozen clock."""
+        with frozen_drift_clock():
+            yield
+
     def _make_market(self, yes_price=50, no_price=50):
-        from datetime import datetime, timedelta, timezone
-        from src.platforms.kalshi import Market
-        now = datetime.now(timezone.utc)
-        return Market(
-            ticker="KXETH15M-TEST",
-            title="Test market",
-            event_ticker="KXETH15M",
-            status="open",
-            yes_price=yes_price,
-            no_price=no_price,
-            volume=1000,
-            close_time=(now + timedelta(minutes=10)).isoformat(),
-            open_time=(now - timedelta(minutes=5)).isoformat(),
-            result=None,
-            raw={},
+        return make_market(
+            ticker="KXETH15M-TEST", event_ticker="KXETH15M",
+            yes_price=yes_price, no_price=no_price,
+            minutes_remaining=10.0, minutes_since_open=5.0,
         )
 
-    def _make_orderbook(self):
-        from src.platforms.kalshi import OrderBook
-        return OrderBook(yes_bids=[], no_bids=[])
-
-    def _make_feed(self, current_price=1000.0):
-        feed = MagicMock()
-        feed.is_stale = False
-        feed.current_price.return_value = current_price
-        return feed
-
     def test_near_miss_logs_at_info_level(self, caplog):
         """When drift < min_drift_pct, an INFO log is emitted."""
         s = BTCDriftStrategy(min_drift_pct=0.5)  # need 0.5% drift
         market = self._make_market()
-        ob = self._make_orderbook()
 
         # Seed reference at 1000
-        feed = self._make_feed(current_price=1000.0)
-        s.generate_signal(market, ob, feed)
+        s.generate_signal(market, EMPTY_OB, make_btc_feed(current_price=1000.0))
 
         # Very tiny drift — below 0.5% threshold
-        feed2 = self._make_feed(current_price=1001.0)  # only 0.1% drift
-        with caplog.at_level(logging.INFO, logger="src.strategies.btc_drift"):
-            result = s.generate_signal(market, ob, feed2)
+        feed2 = make_btc_feed(current_price=1001.0)  # only 0.1% drift
+        caplog.set_level(logging.INFO, logger="src.strategies.btc_drift")  # restored at teardown
+        caplog.clear()  # only records from the near-miss call below
+        result = s.generate_signal(market, EMPTY_OB, feed2)
 
         assert result is None
         info_msgs = [r for r in caplog.records if r.levelno == logging.INFO]
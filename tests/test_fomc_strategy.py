@@ -1,15 +1,18 @@
 """
 Tests for src/strategies/fomc_rate.py and src/data/fred.py.
 
-Mocks FREDFeed and Market objects to control inputs.
+Stubs FREDFeed and builds Market objects to control inputs.
 No live HTTP calls.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
 from datetime import date, datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -27,32 +30,62 @@ from src.strategies.fomc_rate import (
 from src.data.fred import FREDFeed, FREDSnapshot
 from src.platforms.kalshi import Market, OrderBook
 
+# Whole file on one pytest-xdist worker (--dist loadgroup), like loadfile: the
+# lru_cached strategies are then built once, not once per worker.
+pytestmark = pytest.mark.xdist_group("fomc")
+
 
 # ── Helpers ───────────────────────────────────────────────────────────
 
 
-def _make_snap(
-    fed_funds_rate: float = 3.64,
-    yield_2yr: float = 3.90,
-    cpi_latest: float = 320.0,
-    cpi_prior: float = 319.5,
-    cpi_prior2: float = 319.0,
-) -> FREDSnapshot:
-    return FREDSnapshot(
-        fed_funds_rate=fed_funds_rate,
-        yield_2yr=yield_2yr,
-        cpi_latest=cpi_latest,
-        cpi_prior=cpi_prior,
-        cpi_prior2=cpi_prior2,
-        fetched_at=datetime.now(timezone.utc),
-    )
+# Fixed fetch time: nothing under test reads it, so every snapshot can share it.
+_FETCHED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+_DEFAULT_SNAP = FREDSnapshot(
+    fed_funds_rate=3.64,
+    yield_2yr=3.90,
+    cpi_latest=320.0,
+    cpi_prior=319.5,
+    cpi_prior2=319.0,
+    fetched_at=_FETCHED_AT,
+)
+
+
+@pytest.fixture(scope="session")
+def default_snap() -> FREDSnapshot:
+    """One default snapshot for the whole run — the strategy only reads it."""
+    return _DEFAULT_SNAP
+
+
+def _make_snap(base: Optional[FREDSnapshot] = None, **overrides) -> FREDSnapshot:
+    """Variant of *base* (default snapshot if omitted) with *overrides* applied."""
+    base = base or _DEFAULT_SNAP
+    return dataclasses.replace(base, **overrides) if overrides else base
+
 
+class _StubFRED:
+    """FREDFeed stand-in: the strategy only reads is_stale and snapshot()."""
 
-def _make_fred(snap: FREDSnapshot, stale: bool = False) -> FREDFeed:
-    feed = MagicMock(spec=FREDFeed)
-    feed.is_stale = stale
-    feed.snapshot.return_value = snap
-    return feed
+    __slots__ = ("is_stale", "_snap")
+
+    def __init__(self, snap: Optional[FREDSnapshot], stale: bool = False):
+        self.is_stale = stale
+        self._snap = snap
+
+    def snapshot(self) -> Optional[FREDSnapshot]:
+        return self._snap
+
+
+def _make_fred(snap: Optional[FREDSnapshot], stale: bool = False) -> _StubFRED:
+    return _StubFRED(snap, stale)
+
+
+# Markets are built against one clock read at import. The strategy still reads
+# the real clock, but every time-remaining case sits far from its threshold
+# (5000 vs >1 min, 30 vs >60 min), so drift over a run never matters. A fixed
+# calendar date would not work: every close_time would end up in the past.
+_NOW = datetime.now(timezone.utc)
+_OPEN_TIME_ISO = (_NOW - timedelta(hours=100)).isoformat()
 
 
 def _make_market(
@@ -62,9 +95,7 @@ def _make_market(
     no_price: int = 30,
     minutes_remaining: float = 5000.0,
 ) -> Market:
-    now = datetime.now(timezone.utc)
-    close_time = (now + timedelta(minutes=minutes_remaining)).isoformat()
-    open_time = (now - timedelta(hours=100)).isoformat()
+    close_time = (_NOW + timedelta(minutes=minutes_remaining)).isoformat()
     return Market(
         ticker=ticker,
         title=title,
@@ -74,84 +105,113 @@ def _make_market(
         no_price=no_price,
         volume=1000,
         close_time=close_time,
-        open_time=open_time,
+        open_time=_OPEN_TIME_ISO,
         result=None,
         raw={},
     )
 
 
-def _default_strategy(
-    snap: FREDSnapshot = None,
+def _snap_key(snap: FREDSnapshot) -> tuple:
+    """Hashable stand-in for a FREDSnapshot (which isn't hashable): its field values."""
+    return dataclasses.astuple(snap)
+
+
+def _snap_from_key(key: tuple) -> FREDSnapshot:
+    return FREDSnapshot(*key)
+
+
+def _make_strategy(
+    snap: Optional[FREDSnapshot] = None,
+    stale: bool = False,
     days_before: int = 365,   # large window so timing gate never blocks
+    min_edge_pct: float = 0.01,
+    min_minutes_remaining: float = 1.0,
+    days_away: Optional[int] = 5,   # what the strategy's days_until_fomc() returns
+) -> FOMCRateStrategy:
+    # Resolve defaults before the cache lookup, so _make_strategy() and
+    # _make_strategy(_make_snap(), min_edge_pct=0.01) hit the same entry.
+    return _cached_strategy(
+        _snap_key(snap or _DEFAULT_SNAP), stale, days_before,
+        min_edge_pct, min_minutes_remaining, days_away,
+    )
+
+
+# FOMCRateStrategy keeps no per-call state, so tests with the same config share
+# one instance for the whole session.
+@functools.lru_cache(maxsize=None)
+def _cached_strategy(
+    snap_key, stale, days_before, min_edge_pct, min_minutes_remaining, days_away,
 ) -> FOMCRateStrategy:
-    snap = snap or _make_snap()
     return FOMCRateStrategy(
-        fred_feed=_make_fred(snap),
-        min_edge_pct=0.01,
-        min_minutes_remaining=1.0,
+        fred_feed=_make_fred(_snap_from_key(snap_key), stale),
         days_before_meeting=days_before,
+        min_edge_pct=min_edge_pct,
+        min_minutes_remaining=min_minutes_remaining,
+        days_until_fomc_fn=lambda: days_away,
     )
 
 
+# compute_model_probs is pure, so each (snapshot, band/adjustment) pair is
+# computed once per session. The returned dicts are shared — read them only.
+@functools.lru_cache(maxsize=None)
+def _cached_probs(snap_key: tuple, **kwargs) -> dict:
+    return compute_model_probs(_snap_from_key(snap_key), **kwargs)
+
+
+def _model_probs(snap: FREDSnapshot, **kwargs) -> dict:
+    return _cached_probs(_snap_key(snap), **kwargs)
+
+
 # ── FOMC calendar ─────────────────────────────────────────────────────
 
 
+# Sorted once at import; the calendar test compares against it.
+_SORTED_DATES = tuple(sorted(FOMC_DECISION_DATES_2026))
+
+
 class TestFOMCCalendar:
     def test_meeting_dates_are_sorted(self):
-        dates = FOMC_DECISION_DATES_2026
-        assert dates == sorted(dates)
+        assert tuple(FOMC_DECISION_DATES_2026) == _SORTED_DATES
 
     def test_eight_meetings_in_2026(self):
         assert len(FOMC_DECISION_DATES_2026) == 8
 
-    def test_next_fomc_date_returns_future(self):
-        result = next_fomc_date(date(2026, 1, 1))
-        assert result == date(2026, 1, 29)
-
-    def test_next_fomc_date_on_meeting_day(self):
-        """On the meeting day itself, return that date."""
-        result = next_fomc_date(date(2026, 3, 19))
-        assert result == date(2026, 3, 19)
+    @pytest.mark.parametrize("today,expected", [
+        (date(2026, 1, 1), date(2026, 1, 29)),
+        (date(2026, 3, 19), date(2026, 3, 19)),   # meeting day itself → that date
+        (date(2026, 12, 11), None),               # after December 10, none remain
+    ], ids=["future", "meeting_day", "after_last_meeting"])
+    def test_next_fomc_date(self, today, expected):
+        assert next_fomc_date(today) == expected
 
-    def test_next_fomc_after_last_meeting(self):
-        """After December 10, no meetings remain."""
-        result = next_fomc_date(date(2026, 12, 11))
-        assert result is None
-
-    def test_days_until_fomc_from_known_date(self):
-        result = days_until_fomc(date(2026, 3, 12))
-        assert result == 7   # 7 days before March 19
-
-    def test_days_until_fomc_on_meeting_day(self):
-        assert days_until_fomc(date(2026, 1, 29)) == 0
+    @pytest.mark.parametrize("today,expected", [
+        (date(2026, 3, 12), 7),   # 7 days before March 19
+        (date(2026, 1, 29), 0),
+    ], ids=["week_before", "meeting_day"])
+    def test_days_until_fomc(self, today, expected):
+        assert days_until_fomc(today) == expected
 
 
 # ── Ticker parsing ────────────────────────────────────────────────────
 
 
 class TestParseAction:
-    def test_hold(self):
-        assert parse_fomc_action("KXFEDDECISION-26MAR-H0") == FedAction.HOLD
-
-    def test_cut_25(self):
-        assert parse_fomc_action("KXFEDDECISION-26MAR-C25") == FedAction.CUT_25
-
-    def test_cut_large(self):
-        assert parse_fomc_action("KXFEDDECISION-26MAR-C26") == FedAction.CUT_LARGE
-
-    def test_hike_25(self):
-        assert parse_fomc_action("KXFEDDECISION-26MAR-H25") == FedAction.HIKE_25
-
-    def test_hike_large(self):
-        assert parse_fomc_action("KXFEDDECISION-26MAR-H26") == FedAction.HIKE_LARGE
-
-    def test_invalid_ticker_returns_none(self):
-        assert parse_fomc_action("KXBTC15M-26MAR-123") is None
-        assert parse_fomc_action("HIGHNY-26FEB28-T6467") is None
-        assert parse_fomc_action("") is None
-
-    def test_unknown_suffix_returns_none(self):
-        assert parse_fomc_action("KXFEDDECISION-26MAR-Z99") is None
+    @pytest.mark.parametrize("ticker,expected", [
+        ("KXFEDDECISION-26MAR-H0", FedAction.HOLD),
+        ("KXFEDDECISION-26MAR-C25", FedAction.CUT_25),
+        ("KXFEDDECISION-26MAR-C26", FedAction.CUT_LARGE),
+        ("KXFEDDECISION-26MAR-H25", FedAction.HIKE_25),
+        ("KXFEDDECISION-26MAR-H26", FedAction.HIKE_LARGE),
+        ("KXBTC15M-26MAR-123", None),
+        ("HIGHNY-26FEB28-T6467", None),
+        ("", None),
+        ("KXFEDDECISION-26MAR-Z99", None),   # unknown suffix
+    ], ids=[
+        "hold", "cut_25", "cut_large", "hike_25", "hike_large",
+        "btc_ticker", "weather_ticker", "empty", "unknown_suffix",
+    ])
+    def test_parse(self, ticker, expected):
+        assert parse_fomc_action(ticker) == expected
 
 
 # ── Model probabilities ───────────────────────────────────────────────
@@ -160,26 +220,26 @@ class TestParseAction:
 class TestComputeModelProbs:
     def test_probs_sum_to_one(self):
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=3.90)
-        probs = compute_model_probs(snap)
+        probs = _model_probs(snap)
         assert abs(sum(probs.values()) - 1.0) < 0.001
 
     def test_hold_dominant_when_spread_near_zero(self):
         """Spread = 0 → hold regime → P(hold) > all others."""
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=3.64)
-        probs = compute_model_probs(snap)
+        probs = _model_probs(snap)
         assert probs[FedAction.HOLD] > 0.60
         assert probs[FedAction.HOLD] == max(probs.values())
 
     def test_cut_dominant_when_spread_very_negative(self):
         """Spread = -1.0 → aggressive cut regime → P(cut_25) is highest."""
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=2.64)
-        probs = compute_model_probs(snap)
+        probs = _model_probs(snap)
         assert probs[FedAction.CUT_25] > probs[FedAction.HOLD]
 
     def test_hike_bias_when_spread_positive(self):
         """Spread = +0.50% → hike bias → P(hike_25) elevated."""
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=4.14)
-        probs = compute_model_probs(snap)
+        probs = _model_probs(snap)
         assert probs[FedAction.HIKE_25] > 0.20
 
     def test_cpi_accelerating_reduces_cut_prob(self):
@@ -192,22 +252,21 @@ class TestComputeModelProbs:
             fed_funds_rate=3.64, yield_2yr=3.30,
             cpi_latest=319.0, cpi_prior=320.0, cpi_prior2=321.0,
         )
-        p_accel = compute_model_probs(snap_accel)
-        p_decel = compute_model_probs(snap_decel)
+        p_accel = _model_probs(snap_accel)
+        p_decel = _model_probs(snap_decel)
         assert p_accel[FedAction.CUT_25] < p_decel[FedAction.CUT_25]
         assert p_accel[FedAction.HOLD] > p_decel[FedAction.HOLD]
 
-    def test_all_actions_have_nonzero_probability(self):
-        snap = _make_snap()
-        probs = compute_model_probs(snap)
+    def test_all_actions_have_nonzero_probability(self, default_snap):
+        probs = _model_probs(default_snap)
         for action in FedAction:
             assert probs[action] > 0.0, f"{action} probability is zero"
 
     def test_custom_band_widens_hold_regime(self):
         """A wider band should give more weight to hold in mild-spread regimes."""
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=3.80)  # spread = +0.16%
-        probs_narrow = compute_model_probs(snap, spread_hold_band=0.10)
-        probs_wide   = compute_model_probs(snap, spread_hold_band=0.50)
+        probs_narrow = _model_probs(snap, spread_hold_band=0.10)
+        probs_wide   = _model_probs(snap, spread_hold_band=0.50)
         # With narrow band, +0.16% is outside band → hike bias
         # With wide band, +0.16% is inside band → hold bias
         assert probs_wide[FedAction.HOLD] > probs_narrow[FedAction.HOLD]
@@ -249,9 +308,9 @@ class TestFOMCFactory:
         # A freshly constructed FREDFeed has never been refreshed → always stale
         assert s._fred.is_stale is True
 
-    def test_load_from_config_shares_passed_fred_feed(self):
+    def test_load_from_config_shares_passed_fred_feed(self, default_snap):
         """Regression: load_from_config(fred_feed=...) uses the provided (non-stale) instance."""
-        shared_feed = _make_fred(_make_snap(), stale=False)
+        shared_feed = _make_fred(default_snap, stale=False)
         s = load_from_config(fred_feed=shared_feed)
         assert s._fred is shared_feed, "Strategy must use the same FREDFeed instance passed to it"
         assert s._fred.is_stale is False
@@ -262,29 +321,17 @@ class TestFOMCFactory:
 
 class TestTimingGate:
     def test_meeting_far_away_blocks_signal(self):
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(_make_snap()),
-            days_before_meeting=7,
-            min_edge_pct=0.01,
-            min_minutes_remaining=1.0,
-        )
+        # Meeting 30 days out — outside the 7-day window
+        s = _make_strategy(days_before=7, days_away=30)
         market = _make_market()
         ob = OrderBook(yes_bids=[], no_bids=[])
-        # Patch days_until_fomc to return 30 (outside 7-day window)
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=30):
-            assert s.generate_signal(market, ob, None) is None
+        assert s.generate_signal(market, ob, None) is None
 
     def test_meeting_within_window_passes(self):
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(_make_snap(fed_funds_rate=3.64, yield_2yr=3.64)),
-            days_before_meeting=14,
-            min_edge_pct=0.01,
-            min_minutes_remaining=1.0,
-        )
+        s = _make_strategy(_make_snap(fed_funds_rate=3.64, yield_2yr=3.64), days_before=14, days_away=7)
         market = _make_market(ticker="KXFEDDECISION-26MAR-C25", yes_price=5, no_price=95)
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=7):
-            result = s.generate_signal(market, ob, None)
+        result = s.generate_signal(market, ob, None)
         # May or may not signal, but should not be blocked by timing gate
         assert result is None or result is not None  # just checking no crash
 
@@ -294,25 +341,20 @@ class TestTimingGate:
 
 class TestFREDGate:
     def test_stale_fred_returns_none(self):
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(_make_snap(), stale=True),
-            days_before_meeting=365,
-            min_edge_pct=0.01,
-            min_minutes_remaining=1.0,
-        )
+        s = _make_strategy(stale=True)
         market = _make_market()
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            assert s.generate_signal(market, ob, None) is None
+        assert s.generate_signal(market, ob, None) is None
 
     def test_none_snapshot_returns_none(self):
-        feed = _make_fred(_make_snap())
-        feed.snapshot.return_value = None
-        s = FOMCRateStrategy(fred_feed=feed, days_before_meeting=365, min_edge_pct=0.01, min_minutes_remaining=1.0)
+        feed = _make_fred(None)
+        s = FOMCRateStrategy(
+            fred_feed=feed, days_before_meeting=365, min_edge_pct=0.01,
+            min_minutes_remaining=1.0, days_until_fomc_fn=lambda: 5,
+        )
         market = _make_market()
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            assert s.generate_signal(market, ob, None) is None
+        assert s.generate_signal(market, ob, None) is None
 
 
 # ── Gate 3: Ticker parsing ────────────────────────────────────────────
@@ -320,11 +362,10 @@ class TestFREDGate:
 
 class TestTickerGate:
     def test_unrecognised_ticker_returns_none(self):
-        s = _default_strategy()
+        s = _make_strategy()
         market = _make_market(ticker="KXBTC15M-26MAR-H0")
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            assert s.generate_signal(market, ob, None) is None
+        assert s.generate_signal(market, ob, None) is None
 
 
 # ── Gate 4: Time remaining ────────────────────────────────────────────
@@ -332,16 +373,10 @@ class TestTickerGate:
 
 class TestTimeRemainingGate:
     def test_expired_market_returns_none(self):
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(_make_snap()),
-            days_before_meeting=365,
-            min_edge_pct=0.01,
-            min_minutes_remaining=60.0,
-        )
+        s = _make_strategy(min_minutes_remaining=60.0)
         market = _make_market(minutes_remaining=30.0)  # below 60 min threshold
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            assert s.generate_signal(market, ob, None) is None
+        assert s.generate_signal(market, ob, None) is None
 
 
 # ── Signal generation ─────────────────────────────────────────────────
@@ -355,19 +390,13 @@ class TestSignalGeneration:
         Expected: BUY YES on HOLD market.
         """
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=3.64)  # spread = 0
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(snap),
-            days_before_meeting=365,
-            min_edge_pct=0.01,
-            min_minutes_remaining=1.0,
-        )
+        s = _make_strategy(snap)
         market = _make_market(
             ticker="KXFEDDECISION-26MAR-H0",
             yes_price=50, no_price=50,
         )
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            result = s.generate_signal(market, ob, None)
+        result = s.generate_signal(market, ob, None)
         assert result is not None
         assert result.side == "yes"
         assert result.ticker == "KXFEDDECISION-26MAR-H0"
@@ -379,33 +408,21 @@ class TestSignalGeneration:
         Expected: BUY NO on HOLD market.
         """
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=2.64)  # spread = -1.0
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(snap),
-            days_before_meeting=365,
-            min_edge_pct=0.01,
-            min_minutes_remaining=1.0,
-        )
+        s = _make_strategy(snap)
         market = _make_market(
             ticker="KXFEDDECISION-26MAR-H0",
             yes_price=95, no_price=5,
         )
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            result = s.generate_signal(market, ob, None)
+        result = s.generate_signal(market, ob, None)
         assert result is not None
         assert result.side == "no"
 
     def test_high_edge_threshold_blocks_signal(self):
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(_make_snap()),
-            days_before_meeting=365,
-            min_edge_pct=0.99,
-            min_minutes_remaining=1.0,
-        )
+        s = _make_strategy(min_edge_pct=0.99)
         market = _make_market(yes_price=50, no_price=50)
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            assert s.generate_signal(market, ob, None) is None
+        assert s.generate_signal(market, ob, None) is None
 
 
 # ── Signal field validation ───────────────────────────────────────────
@@ -415,16 +432,10 @@ class TestSignalFields:
     @pytest.fixture
     def signal(self):
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=3.64)
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(snap),
-            days_before_meeting=365,
-            min_edge_pct=0.01,
-            min_minutes_remaining=1.0,
-        )
+        s = _make_strategy(snap)
         market = _make_market(ticker="KXFEDDECISION-26MAR-H0", yes_price=50, no_price=50)
         ob = OrderBook(yes_bids=[], no_bids=[])
-        with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-            return s.generate_signal(market, ob, None)
+        return s.generate_signal(market, ob, None)
 
     def test_signal_not_none(self, signal):
         assert signal is not None
@@ -453,17 +464,11 @@ class TestNearMissLog:
     def test_no_edge_logs_at_info(self, caplog):
         """When there's no edge, logs at INFO with market details."""
         snap = _make_snap(fed_funds_rate=3.64, yield_2yr=3.64)  # hold regime
-        s = FOMCRateStrategy(
-            fred_feed=_make_fred(snap),
-            days_before_meeting=365,
-            min_edge_pct=0.99,   # impossibly high → always no-edge
-            min_minutes_remaining=1.0,
-        )
+        s = _make_strategy(snap, min_edge_pct=0.99)  # impossibly high → always no-edge
         market = _make_market(ticker="KXFEDDECISION-26MAR-H0", yes_price=74, no_price=26)
         ob = OrderBook(yes_bids=[], no_bids=[])
         with caplog.at_level(logging.INFO, logger="src.strategies.fomc_rate"):
-            with patch("src.strategies.fomc_rate.days_until_fomc", return_value=5):
-                s.generate_signal(market, ob, None)
+            s.generate_signal(market, ob, None)
         info_records = [r for r in caplog.records if r.levelno == logging.INFO]
         assert len(info_records) >= 1
 
@@ -471,6 +476,30 @@ class TestNearMissLog:
 # ── FREDFeed unit tests ────────────────────────────────────────────────
 
 
+# fredgraph.csv bodies served, in request order, to FREDFeed.refresh().
+_DFF_CSV = b"DATE,VALUE\n2026-02-24,3.64\n2026-02-25,3.64\n"
+_DGS2_CSV = b"DATE,VALUE\n2026-02-24,3.9\n2026-02-25,3.9\n"
+_CPI_CSV = b"DATE,VALUE\n2026-01-01,321.0\n2025-12-01,320.5\n2025-11-01,320.0\n"
+
+
+class _StubResponse:
+    """urlopen() result: a context manager whose read() returns fixed bytes."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self) -> bytes:
+        return self._data
+
+
 class TestFREDFeed:
     def test_is_stale_before_fetch(self):
         feed = FREDFeed()
@@ -482,37 +511,13 @@ class TestFREDFeed:
 
     def test_refresh_success(self):
         """Mock HTTP responses for DFF, DGS2, CPIAUCSL and verify snapshot populated."""
-        import json, io, csv
-
-        def _make_csv(values: list[tuple[str, float]]) -> bytes:
-            buf = io.StringIO()
-            w = csv.writer(buf)
-            w.writerow(["DATE", "VALUE"])
-            for date_str, val in values:
-                w.writerow([date_str, val])
-            return buf.getvalue().encode()
-
-        dff_csv  = _make_csv([("2026-02-24", 3.64), ("2026-02-25", 3.64)])
-        dgs2_csv = _make_csv([("2026-02-24", 3.90), ("2026-02-25", 3.90)])
-        cpi_csv  = _make_csv([
-            ("2026-01-01", 321.0),
-            ("2025-12-01", 320.5),
-            ("2025-11-01", 320.0),
-        ])
-
-        responses = [dff_csv, dgs2_csv, cpi_csv]
+        responses = [_DFF_CSV, _DGS2_CSV, _CPI_CSV]
         call_count = [0]
 
-        from unittest.mock import MagicMock
-
         def mock_urlopen(req, timeout=None):
             idx = call_count[0] % len(responses)
             call_count[0] += 1
-            mock_resp = MagicMock()
-            mock_resp.__enter__ = MagicMock(return_value=mock_resp)
-            mock_resp.__exit__ = MagicMock(return_value=False)
-            mock_resp.read.return_value = responses[idx]
-            return mock_resp
+            return _StubResponse(responses[idx])
 
         with patch("urllib.request.urlopen", side_effect=mock_urlopen):
             feed = FREDFeed()
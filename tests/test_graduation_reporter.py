@@ -10,38 +10,55 @@ Verifies:
 
 from __future__ import annotations
 
+import contextlib
 import io
-import sys
-from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
-from src.db import DB
+from _db_helpers import TradeRow, insert_trade_rows
 
 
 # ── Fixture ───────────────────────────────────────────────────────────
 
 
 @pytest.fixture
-def db(tmp_path):
-    """Fresh DB in a temp directory per test."""
-    d = DB(tmp_path / "test.db")
-    d.init()
-    yield d
-    d.close()
+def db(reset_db):
+    """Empty in-memory DB per test — the conftest session DB, reset at teardown."""
+    return reset_db
 
 
-def _call_print_graduation_status(db) -> str:
+def _call_print_graduation_status(db, capsys) -> str:
     """
     Call print_graduation_status(db) from main.py and capture stdout output.
     Returns the captured output as a string.
     """
     from main import print_graduation_status
-    captured = io.StringIO()
-    with patch("sys.stdout", captured):
-        print_graduation_status(db)
-    return captured.getvalue()
+    capsys.readouterr()  # drop anything printed before the call
+    print_graduation_status(db)
+    return capsys.readouterr().out
+
+
+@pytest.fixture(scope="module")
+def empty_db(clone_db):
+    """One schema-only DB for this module's read-only tests; query_only rejects writes."""
+    d = clone_db()
+    d._conn.execute("PRAGMA query_only = ON")
+    yield d
+    d.close()
+
+
+@pytest.fixture(scope="module")
+def empty_output(empty_db) -> str:
+    """
+    print_graduation_status(empty_db) output, produced once for the module.
+
+    capsys is function-scoped, so this captures with redirect_stdout instead.
+    """
+    from main import print_graduation_status
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        print_graduation_status(empty_db)
+    return buf.getvalue()
 
 
 # ── Tests ─────────────────────────────────────────────────────────────
@@ -50,9 +67,8 @@ def _call_print_graduation_status(db) -> str:
 class TestGraduationStatusPrinter:
     """Tests for print_graduation_status(db)."""
 
-    def test_prints_all_11_strategies(self, db):
+    def test_prints_all_11_strategies(self, empty_output):
         """Empty DB should still print a row for all 11 strategies."""
-        output = _call_print_graduation_status(db)
         strategies = [
             "btc_lag_v1",
             "eth_lag_v1",
@@ -67,69 +83,61 @@ class TestGraduationStatusPrinter:
             "fomc_rate_v1",
         ]
         for strategy in strategies:
-            assert strategy in output, f"Missing strategy in output: {strategy}"
+            assert strategy in empty_output, f"Missing strategy in output: {strategy}"
 
-    def test_header_includes_required_columns(self, db):
+    def test_header_includes_required_columns(self, empty_output):
         """Table header must include Strategy, Trades, Days, Brier, Streak, P&L, Status."""
-        output = _call_print_graduation_status(db)
         for col in ("Strategy", "Trades", "Days", "Brier", "Streak", "P&L", "Status"):
-            assert col in output, f"Missing column in header: {col}"
+            assert col in empty_output, f"Missing column in header: {col}"
 
-    def test_fomc_shows_5_trade_threshold(self, db):
+    def test_fomc_shows_5_trade_threshold(self, empty_output):
         """fomc_rate_v1 requires only 5 trades (not 30) — verify threshold is shown correctly."""
-        output = _call_print_graduation_status(db)
         # Find the fomc_rate_v1 line and check it shows 0/5
-        fomc_line = [line for line in output.splitlines() if "fomc_rate_v1" in line]
+        fomc_line = [line for line in empty_output.splitlines() if "fomc_rate_v1" in line]
         assert fomc_line, "fomc_rate_v1 not found in output"
         assert "0/5" in fomc_line[0], f"Expected 0/5 in fomc line, got: {fomc_line[0]}"
 
-    def test_weather_shows_trade_threshold(self, db):
+    def test_weather_shows_trade_threshold(self, empty_output):
         """weather_forecast_v1 requires 30 trades — day requirement removed."""
-        output = _call_print_graduation_status(db)
-        weather_line = [line for line in output.splitlines() if "weather_forecast_v1" in line]
+        weather_line = [line for line in empty_output.splitlines() if "weather_forecast_v1" in line]
         assert weather_line, "weather_forecast_v1 not found in output"
         assert "0/30" in weather_line[0], f"Expected 0/30 in weather line, got: {weather_line[0]}"
 
-    def test_empty_db_shows_needs_trades_status(self, db):
+    def test_empty_db_shows_needs_trades_status(self, empty_output):
         """With no trades, every strategy should show 'needs' in status."""
-        output = _call_print_graduation_status(db)
-        btc_lag_line = [line for line in output.splitlines() if "btc_lag_v1" in line]
+        btc_lag_line = [line for line in empty_output.splitlines() if "btc_lag_v1" in line]
         assert btc_lag_line, "btc_lag_v1 not found in output"
         assert "needs" in btc_lag_line[0].lower(), (
             f"Expected 'needs' in btc_lag status, got: {btc_lag_line[0]}"
         )
 
-    def test_ready_status_when_all_criteria_met(self, db):
+    def test_ready_status_when_all_criteria_met(self, db, capsys):
         """A strategy with all thresholds met should show READY."""
         # Seed 30 settled, winning trades for btc_lag_v1 with good brier score
         # (win_prob=0.9, outcome=win → brier contribution low)
         import time
         first_ts = time.time() - (8 * 86400)  # 8 days ago
-        for i in range(30):
-            ts = first_ts + i * 100
-            db._conn.execute(
-                """INSERT INTO trades
-                   (timestamp, ticker, side, action, price_cents, count, cost_usd,
-                    strategy, edge_pct, win_prob, is_paper, result, pnl_cents, settled_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (ts, "KXBTC15M-TEST", "yes", "buy", 44, 10, 4.40,
-                 "btc_lag_v1", 0.12, 0.75, 1, "yes", 560, ts + 3600),
+        insert_trade_rows(db, [
+            TradeRow(
+                timestamp=first_ts + i * 100, price_cents=44, count=10, cost_usd=4.40,
+                strategy="btc_lag_v1", edge_pct=0.12, win_prob=0.75,
+                result="yes", pnl_cents=560, settled_at=first_ts + i * 100 + 3600,
             )
-        db._conn.commit()
+            for i in range(30)
+        ])
 
-        output = _call_print_graduation_status(db)
+        output = _call_print_graduation_status(db, capsys)
         btc_lag_line = [line for line in output.splitlines() if "btc_lag_v1" in line]
         assert btc_lag_line, "btc_lag_v1 not found in output"
         assert "READY" in btc_lag_line[0], (
             f"Expected READY in btc_lag status, got: {btc_lag_line[0]}"
         )
 
-    def test_zero_of_11_ready_on_empty_db(self, db):
+    def test_zero_of_11_ready_on_empty_db(self, empty_output):
         """Empty DB should show '0 / 11 strategies ready' (expiry_sniper_v1 added Session 54)."""
-        output = _call_print_graduation_status(db)
-        assert "0 / 11" in output, f"Expected '0 / 11' in output, got:\n{output}"
+        assert "0 / 11" in empty_output, f"Expected '0 / 11' in output, got:\n{empty_output}"
 
-    def test_exits_without_starting_connections(self, db, tmp_path):
+    def test_exits_without_starting_connections(self, empty_db, capsys):
         """
         print_graduation_status should be fast (DB read only) and not attempt
         to import or connect to Kalshi/Binance.
@@ -137,6 +145,6 @@ class TestGraduationStatusPrinter:
         # If this imports quickly and doesn't raise, connections were not started
         import time
         start = time.time()
-        _call_print_graduation_status(db)
+        _call_print_graduation_status(empty_db, capsys)
         elapsed = time.time() - start
         assert elapsed < 5.0, f"print_graduation_status took too long: {elapsed:.1f}s"
@@ -183,12 +183,11 @@ class TestAuthModuleSafety:
 
 # ── Kill switch safety ────────────────────────────────────────────
 
+@pytest.mark.usefixtures("tmp_lock_file")
 class TestKillSwitchSafety:
     def test_single_trade_never_exceeds_hard_max(self):
         """Hard cap of 50 USD must be enforced regardless of bankroll. (S153: raised 35→50 — gate 100 post-guard clean bets)"""
-        from src.risk.kill_switch import KillSwitch, LOCK_FILE
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
+        from src.risk.kill_switch import KillSwitch
         ks = KillSwitch(starting_bankroll_usd=10000.0)
         # Even with a huge bankroll, 50.01 USD must be blocked
         ok, reason = ks.check_order_allowed(trade_usd=50.01, current_bankroll_usd=10000.0)
@@ -196,9 +195,7 @@ class TestKillSwitchSafety:
 
     def test_bankroll_pct_cap_enforced(self):
         """15% of bankroll cap must be enforced at small bankroll sizes. (S65: raised 5%→15%)"""
-        from src.risk.kill_switch import KillSwitch, LOCK_FILE
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
+        from src.risk.kill_switch import KillSwitch
         ks = KillSwitch(starting_bankroll_usd=30.0)
         # 15% of $30 = $4.50, so $5 must be blocked
         ok, _ = ks.check_order_allowed(trade_usd=5.00, current_bankroll_usd=30.0)
@@ -206,9 +203,7 @@ class TestKillSwitchSafety:
 
     def test_hard_stop_requires_manual_reset(self):
         """Once a hard stop is triggered (via auth failures), no trade can pass without manual reset."""
-        from src.risk.kill_switch import KillSwitch, LOCK_FILE, MAX_AUTH_FAILURES
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
+        from src.risk.kill_switch import KillSwitch, MAX_AUTH_FAILURES
         ks = KillSwitch(starting_bankroll_usd=100.0)
         for _ in range(MAX_AUTH_FAILURES):
             ks.record_auth_failure()
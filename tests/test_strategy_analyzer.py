@@ -18,6 +18,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # Patch the DB path before importing the module
 _FAKE_DB = ":memory:"
 
+# run_analysis() reads the live data/polybot.db; a fresh checkout (CI) has none.
+_LIVE_DB = Path(__file__).parent.parent / "data" / "polybot.db"
+
+
+def _live_db_has_trades() -> bool:
+    if not _LIVE_DB.exists():  # sqlite3.connect() would create it
+        return False
+    conn = sqlite3.connect(_LIVE_DB)
+    try:
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='trades'"
+        ).fetchone() is not None
+    finally:
+        conn.close()
+
+
+requires_live_db = unittest.skipUnless(
+    _live_db_has_trades(), "needs data/polybot.db with a trades table"
+)
+
 
 def _make_conn(trades: list[dict]) -> sqlite3.Connection:
     """Create an in-memory DB with the trades schema and insert test data."""
@@ -364,6 +384,7 @@ class TestRecommendationGeneration(unittest.TestCase):
         self.assertTrue(any("93.04" in r for r in recs))
 
 
+@requires_live_db
 class TestRunAnalysisIntegration(unittest.TestCase):
     def test_full_run_no_save(self):
         """run_analysis with save=False completes without crash."""
@@ -545,6 +566,7 @@ class TestGenerateReflection(unittest.TestCase):
         self.assertIn("GOLD", text)
         self.assertIn("crypto_sniper", text)
 
+    @requires_live_db
     def test_run_analysis_includes_benchmark(self):
         """run_analysis() result includes benchmark key."""
         from scripts.strategy_analyzer import run_analysis
@@ -553,6 +575,7 @@ class TestGenerateReflection(unittest.TestCase):
         self.assertIn("funding_gap_usd", result["benchmark"])
         self.assertIn("strategies", result["benchmark"])
 
+    @requires_live_db
     def test_reflect_mode_writes_file(self):
         """--reflect mode writes data/session_reflection.md."""
         import tempfile
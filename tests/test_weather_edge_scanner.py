@@ -11,9 +11,15 @@ import math
 import sys
 from pathlib import Path
 
+import pytest
+
 # Bootstrap path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+# weather_edge_scanner loads .env at import time; a fresh checkout (CI) has none.
+if not (Path(__file__).resolve().parent.parent / ".env").exists():
+    pytest.skip("scripts/weather_edge_scanner.py needs a .env to import", allow_module_level=True)
+
 from scripts.weather_edge_scanner import (
     parse_weather_bracket,
     gefs_prob_yes,